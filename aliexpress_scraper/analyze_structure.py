@@ -1,14 +1,55 @@
 #!/usr/bin/env python3
-"""Analyze the actual structure of items to find store information."""
+"""Analyze the actual structure of items to find store information.
+
+Reads debug_data.json as written by `debug_search.py -v`.
+"""
 
 import json
 
-# Load the debug data
-with open("debug_data.json", "r") as f:
-    data = json.load(f)
+try:
+    import ijson  # type: ignore
+
+    _HAS_IJSON = True
+except ImportError:  # pragma: no cover - optional
+    _HAS_IJSON = False
+
+
+def _p4p(item):
+    """Return the item's p4pExtendParam, or None when any level is missing."""
+    try:
+        return item['trace']['p4pExposure']['p4pExtendParam']
+    except (KeyError, TypeError):
+        return None
+
+
+def _ut_log(item):
+    """Return the item's trace utLogMap, or None when missing."""
+    try:
+        return item['trace']['utLogMap']
+    except (KeyError, TypeError):
+        return None
 
-# Get the items
-items = data["data"]["root"]["fields"]["mods"]["itemList"]["content"]
+
+def _load_items(path):
+    """The search item list from a debug_data.json dump.
+
+    Streams just the list with ijson when it is installed (use_float needs
+    ijson >= 3.1; older versions fall back too), else loads the whole file.
+    """
+    with open(path, "rb") as f:
+        if _HAS_IJSON:
+            try:
+                return list(ijson.items(f, "data.root.fields.mods.itemList.content.item", use_float=True))
+            except TypeError:
+                f.seek(0)
+        data = json.load(f)
+    try:
+        return data["data"]["root"]["fields"]["mods"]["itemList"]["content"]
+    except (KeyError, TypeError):
+        return []
+
+
+items = _load_items("debug_data.json")
 print(f"Total items: {len(items)}")
 
 # Analyze first few items for store information
@@ -24,28 +65,32 @@ for i, item in enumerate(items[:5]):
         print("No direct 'store' field")
     
     # Check trace field for store info
-    trace = item.get('trace', {})
-    if trace:
-        # Check p4pExposure
-        p4p_exposure = trace.get('p4pExposure', {})
-        if p4p_exposure and 'p4pExtendParam' in p4p_exposure:
-            print(f"P4P store info: {p4p_exposure['p4pExtendParam']}")
-        
-        # Check utLogMap for store info
-        ut_log = trace.get('utLogMap', {})
-        store_keys = [k for k in ut_log.keys() if 'store' in k.lower()]
-        if store_keys:
-            print(f"Store keys in utLogMap: {store_keys}")
-            for key in store_keys:
-                print(f"  {key}: {ut_log[key]}")
+    p4p = _p4p(item)
+    if p4p is not None:
+        print(f"P4P store info: {p4p}")
+    
+    # Check utLogMap for store info
+    ut_log = _ut_log(item)
+    if ut_log:
+        # utLogMap keys are camelCase, so the two casings cover them without lowercasing
+        store_items = [(k, v) for k, v in ut_log.items() if 'store' in k or 'Store' in k]
+        if store_items:
+            print(f"Store keys in utLogMap: {[k for k, _ in store_items]}")
+            for key, value in store_items:
+                print(f"  {key}: {value}")
     
     # Check all top-level keys
     print(f"Top-level keys: {list(item.keys())}")
     
 print(f"\n=== Summary ===")
-# Count items with different types of store information
-store_field_count = sum(1 for item in items if 'store' in item)
-p4p_store_count = sum(1 for item in items if 'p4pExtendParam' in item.get('trace', {}).get('p4pExposure', {}))
+# Count items with different types of store information in a single pass
+store_field_count = 0
+p4p_store_count = 0
+for item in items:
+    if 'store' in item:
+        store_field_count += 1
+    if _p4p(item) is not None:
+        p4p_store_count += 1
 print(f"Items with 'store' field: {store_field_count}")
 print(f"Items with p4pExtendParam: {p4p_store_count}")
 
@@ -2,13 +2,43 @@
 """Debug script to test the search parsing logic."""
 
 import asyncio
-import os
 import json
+import os
 import re
+import sys
+from pathlib import Path
+
+from lxml.etree import XPath
 from scrapfly import ScrapflyClient, ScrapeConfig
 from parsel import Selector
 
+try:
+    import orjson  # type: ignore
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - optional
+    _HAS_ORJSON = False
+
 _INIT_DATA_RE = re.compile(r"_init_data_\s*=\s*{\s*data:\s*({.+}) }", re.S)
+_XP_SCRIPT_TEXT = XPath("//script/text()", smart_strings=False)
+
+# Debug artifacts are multi-MB; only write them when asked to
+VERBOSE = "-v" in sys.argv or "--verbose" in sys.argv
+
+
+def _json_loads(raw: str):
+    return orjson.loads(raw) if _HAS_ORJSON else json.loads(raw)
+
+
+def _json_dumps_pretty(obj) -> bytes:
+    if _HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+async def _write_artifact(name: str, data: bytes) -> None:
+    """Write a debug artifact off the event loop."""
+    await asyncio.to_thread(Path(name).write_bytes, data)
 
 async def debug_search():
     key = os.environ.get("SCRAPFLY_KEY")
@@ -35,9 +65,9 @@ async def debug_search():
     print(f"Response length: {len(res.content)}")
     
     # Save raw HTML for inspection
-    with open("debug_response.html", "w", encoding="utf-8") as f:
-        f.write(res.content)
-    print("Saved raw HTML to debug_response.html")
+    if VERBOSE:
+        await _write_artifact("debug_response.html", res.content.encode("utf-8"))
+        print("Saved raw HTML to debug_response.html")
     
     # Parse with Parsel
     sel = Selector(res.content)
@@ -47,7 +77,7 @@ async def debug_search():
     if not scripts:
         print("No scripts found with _init_data_")
         # Let's try to find other potential data sources
-        all_scripts = sel.xpath('//script/text()').getall()
+        all_scripts = _XP_SCRIPT_TEXT(sel.root)
         print(f"Total scripts found: {len(all_scripts)}")
         
         for i, script in enumerate(all_scripts[:5]):  # Check first 5 scripts
@@ -58,22 +88,30 @@ async def debug_search():
         return
     
     # Try to extract JSON data
-    script_content = "\n".join(s.get() for s in scripts)
+    script_texts = scripts.getall()
     print("Found script with _init_data_")
     
     # Save script content
-    with open("debug_script.js", "w", encoding="utf-8") as f:
-        f.write(script_content)
-    print("Saved script content to debug_script.js")
+    if VERBOSE:
+        await _write_artifact("debug_script.js", "\n".join(script_texts).encode("utf-8"))
+        print("Saved script content to debug_script.js")
     
-    m = _INIT_DATA_RE.search(script_content)
+    # Match script by script and stop at the first hit; the literal check skips
+    # scripts that can't match without running the dot-all regex over them
+    m = None
+    for text in script_texts:
+        if "_init_data_" not in text:
+            continue
+        m = _INIT_DATA_RE.search(text)
+        if m:
+            break
     if not m:
         print("Could not match _init_data_ pattern")
         # Let's try a broader search
-        if "_init_data_" in script_content:
+        if any("_init_data_" in text for text in script_texts):
             print("_init_data_ found in script, but regex didn't match")
             # Find the actual pattern
-            lines = script_content.split('\n')
+            lines = "\n".join(script_texts).split('\n')
             for i, line in enumerate(lines):
                 if "_init_data_" in line:
                     print(f"Line {i}: {line}")
@@ -83,13 +121,13 @@ async def debug_search():
     json_str = m.group(1)
     
     try:
-        data = json.loads(json_str)
+        data = _json_loads(json_str)
         print("Successfully parsed JSON")
         
         # Save parsed data
-        with open("debug_data.json", "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-        print("Saved parsed data to debug_data.json")
+        if VERBOSE:
+            await _write_artifact("debug_data.json", _json_dumps_pretty(data))
+            print("Saved parsed data to debug_data.json")
         
         # Navigate the data structure
         fields = data.get("data", {}).get("root", {}).get("fields", {})
@@ -106,9 +144,9 @@ async def debug_search():
         
         if content:
             print("First item keys:", list(content[0].keys()))
-            print("First item:", json.dumps(content[0], indent=2))
+            print("First item:", _json_dumps_pretty(content[0]).decode("utf-8"))
         
-    except json.JSONDecodeError as e:
+    except json.JSONDecodeError as e:  # orjson's error subclasses it
         print(f"JSON parsing failed: {e}")
         # Save the problematic JSON for inspection
         with open("debug_json_raw.txt", "w", encoding="utf-8") as f:
@@ -17,6 +17,7 @@ async def main() -> None:
         country="AU",
         key=key,
         cookie=None,
+        concurrency=cfg.concurrency,
     )
     print(result.to_dict())
 
@@ -2,6 +2,61 @@
 Improved scraper focused on extracting key data: price, reviews, shipping
 """
 
+import re
+from itertools import islice
+
+from lxml.etree import XPath
+
+# JS-rendering options per attempt, cheapest first
+_RENDER_ATTEMPTS = (
+    {"rendering_wait": 2500, "wait_for_selector": "h1"},
+    {"rendering_wait": 10000, "auto_scroll": True},
+)
+_PRICE_RE = re.compile(r'(AU\s*)?[\$]\s*(\d+[\.,]?\d*)')
+_SCRIPT_PRICE_RE = re.compile(r'"price":\s*"?(\d+\.?\d*)"?|"formattedPrice":\s*"([^"]+)"')
+# Rating, review-count and order-count patterns fused into one alternation;
+# the matching named group tells which metric a hit belongs to.
+_METRICS_RE = re.compile(
+    r'(?P<rating>\d\.\d)\s*(?:star|rating|out\s*of\s*5)'
+    r'|rating["\s:]*(?P<rating2>\d\.\d)'
+    r'|(?P<reviews>\d+(?:,\d+)*)\s*(?:review|rating|people\s*rated)'
+    r'|based\s*on\s*(?P<reviews2>\d+(?:,\d+)*)'
+    r'|(?P<orders>\d+(?:,\d+)*(?:\.\d+)?k?)\s*(?:sold|order|piece)'
+    r'|(?P<orders2>\d+(?:,\d+)*)\s*people\s*bought'
+    r'|(?P<orders3>\d+(?:,\d+)*)\+\s*sold'
+)
+_RATING_VAL_RE = re.compile(r'(\d+\.?\d*)(?:%|/5)')
+_NUM_RE = re.compile(r'(\d+(?:,\d+)*)')
+_ALIE_IMG_RE = re.compile(r'^https?://\S*aliexpress')
+
+# XPath expressions compiled once; evaluated directly against the lxml root of a Selector
+_XP_TITLE = XPath("//h1//text()", smart_strings=False)
+_XP_PRICE_SCRIPTS = XPath('//script[contains(., "price") or contains(., "Price")]//text()', smart_strings=False)
+_XP_ALL_TEXT = XPath("//text()", smart_strings=False)
+_XP_SHIPPING = XPath(
+    "//*[contains(text(), 'shipping') or contains(text(), 'delivery') or contains(text(), 'days')]//text()",
+    smart_strings=False,
+)
+_XP_IMAGES = (
+    XPath("//div[contains(@class, 'image-view')]//img/@src", smart_strings=False),
+    XPath("//div[contains(@class, 'product-image')]//img/@src", smart_strings=False),
+    XPath("//img[contains(@alt, 'product')]/@src", smart_strings=False),
+)
+_XP_STORE_LINKS = XPath("//a[contains(@href, '/store/') or contains(@href, '/shop/')]/@href", smart_strings=False)
+# Seller page: cap the candidate lists inside lxml rather than slicing afterwards
+_XP_SELLER_RATING = XPath(
+    "(//*[contains(text(), '.') and (contains(text(), '%') or contains(., '/5'))]//text())[position() <= 5]",
+    smart_strings=False,
+)
+_XP_SELLER_FOLLOWERS = XPath("(//*[contains(text(), 'follow')]//text())[position() <= 3]", smart_strings=False)
+_COUNTRY_RE = re.compile(r'\b(?:China|USA|UK|Germany|Japan)\b')
+_XP_STORE_NAMES = (
+    XPath("//a[contains(@href, '/store/')]//text()", smart_strings=False),
+    XPath("//span[contains(@class, 'store') or contains(@class, 'seller')]//text()", smart_strings=False),
+    XPath("//*[contains(text(), 'Store') or contains(text(), 'Shop')]//text()", smart_strings=False),
+)
+
+
 async def scrape_product_and_store_sf_improved(sf_cfg: ScrapflyConfig, url: str) -> Tuple[Optional[Product], Optional[Tuple[str, str]]]:
     """Scrape product info with focus on price, reviews, and shipping details."""
     ScrapflyClient, ScrapeConfig, Selector = _require_scrapfly()
@@ -9,52 +64,62 @@ async def scrape_product_and_store_sf_improved(sf_cfg: ScrapflyConfig, url: str)
     headers = {"accept-language": "en-US,en;q=0.9"}
     if sf_cfg.cookie:
         headers["cookie"] = sf_cfg.cookie
+    pid = url.split("item/")[-1].split(".")[0]
 
     try:
-        res = await client.async_scrape(
-            ScrapeConfig(
-                url,
-                asp=True,
-                country=sf_cfg.country,
-                headers=headers,
-                render_js=True,
-                auto_scroll=True,
-                rendering_wait=10000,
-            )
-        )
+        # Return as soon as the title exists, and only pay for the long blind
+        # wait + auto-scroll when that first render fails
+        res = None
+        for attempt, render_opts in enumerate(_RENDER_ATTEMPTS):
+            try:
+                res = await client.async_scrape(
+                    ScrapeConfig(
+                        url,
+                        asp=True,
+                        country=sf_cfg.country,
+                        headers=headers,
+                        render_js=True,
+                        **render_opts,
+                    )
+                )
+            except Exception:
+                if attempt == len(_RENDER_ATTEMPTS) - 1:
+                    raise
+                continue
+            if res.status_code == 200:
+                break
         
-        if res.status_code != 200:
+        if res is None or res.status_code != 200:
             return None, None
         
-        sel = Selector(res.content)
+        root = Selector(res.content).root
         
         # === TITLE EXTRACTION ===
         title = ""
-        title_candidates = sel.xpath("//h1//text()").getall()
+        title_candidates = _XP_TITLE(root)
         for candidate in title_candidates:
             candidate = candidate.strip()
             if len(candidate) > 10:  # Get a meaningful title, not just short text
                 title = candidate
                 break
         
-        # === PRICE EXTRACTION ===
+        # === PRICE - walk the page text nodes (shared with the metrics below) ===
         price_text = None
-        # Look for price in various formats
-        all_text = sel.xpath("//*[contains(text(), '$') or contains(text(), 'AU')]//text()").getall()
-        for text in all_text:
-            text = text.strip()
-            # Match price patterns like $12.34, AU $45.67, etc.
-            import re
-            price_match = re.search(r'(AU\s*)?[\$]\s*(\d+[\.,]?\d*)', text)
-            if price_match:
-                price_text = price_match.group(0)
-                break
+        page_text = _XP_ALL_TEXT(root)
+        for text in page_text:
+            # '$' anchors every price pattern; the substring test skips the regex on most nodes
+            if '$' in text:
+                # Match price patterns like $12.34, AU $45.67, etc.
+                price_match = _PRICE_RE.search(text.strip())
+                if price_match:
+                    price_text = price_match.group(0)
+                    break
         
         # Try script data for price if not found
         if not price_text:
-            scripts = sel.xpath('//script[contains(., "price") or contains(., "Price")]//text()').getall()
+            scripts = _XP_PRICE_SCRIPTS(root)
             for script in scripts:
-                price_match = re.search(r'"price":\s*"?(\d+\.?\d*)"?|"formattedPrice":\s*"([^"]+)"', script)
+                price_match = _SCRIPT_PRICE_RE.search(script)
                 if price_match:
                     price_text = price_match.group(1) or price_match.group(2)
                     break
@@ -64,94 +129,50 @@ async def scrape_product_and_store_sf_improved(sf_cfg: ScrapflyConfig, url: str)
         if price_text and ("AU" in price_text or "AUD" in price_text):
             currency = "AUD"
         
-        # === RATING ===
+        # === RATING / REVIEWS / ORDERS - one scan over the page text ===
+        # Nodes are joined with NUL, which no pattern can match across (unlike
+        # "\n", which \s would let a number pair with the next node's "orders")
         rating = None
-        rating_patterns = [
-            r'(\d\.\d)\s*(?:star|rating)',
-            r'rating["\s:]*(\d\.\d)',
-            r'(\d\.\d)\s*out\s*of\s*5'
-        ]
-        page_text = sel.xpath('//text()').getall()
-        for text in page_text:
-            for pattern in rating_patterns:
-                match = re.search(pattern, text.lower())
-                if match:
-                    try:
-                        rating = float(match.group(1))
-                        break
-                    except:
-                        continue
-            if rating:
-                break
-        
-        # === REVIEWS COUNT ===
         num_reviews = None
-        review_patterns = [
-            r'(\d+(?:,\d+)*)\s*(?:review|rating)',
-            r'(\d+(?:,\d+)*)\s*people\s*rated',
-            r'based\s*on\s*(\d+(?:,\d+)*)'
-        ]
-        for text in page_text:
-            for pattern in review_patterns:
-                match = re.search(pattern, text.lower())
-                if match:
-                    try:
-                        num_reviews = int(match.group(1).replace(',', ''))
-                        break
-                    except:
-                        continue
-            if num_reviews:
-                break
-        
-        # === ORDERS/SOLD COUNT ===
         num_orders = None
-        order_patterns = [
-            r'(\d+(?:,\d+)*(?:\.\d+)?[k]?)\s*(?:sold|order|piece)',
-            r'(\d+(?:,\d+)*)\s*people\s*bought',
-            r'(\d+(?:,\d+)*)\+?\s*sold'
-        ]
-        for text in page_text:
-            for pattern in order_patterns:
-                match = re.search(pattern, text.lower())
-                if match:
-                    try:
-                        sold_str = match.group(1).replace(',', '')
-                        if 'k' in sold_str.lower():
-                            num_orders = int(float(sold_str.lower().replace('k', '')) * 1000)
-                        else:
-                            num_orders = int(sold_str)
-                        break
-                    except:
-                        continue
-            if num_orders:
+        for match in _METRICS_RE.finditer("\x00".join(page_text).lower()):
+            kind = match.lastgroup
+            try:
+                if kind in ("rating", "rating2"):
+                    if rating is None:
+                        rating = float(match.group(kind))
+                elif kind in ("reviews", "reviews2"):
+                    if num_reviews is None:
+                        num_reviews = int(match.group(kind).replace(',', ''))
+                elif num_orders is None:
+                    sold_str = match.group(kind).replace(',', '')
+                    if 'k' in sold_str:
+                        num_orders = int(float(sold_str.replace('k', '')) * 1000)
+                    else:
+                        num_orders = int(sold_str)
+            except ValueError:
+                continue
+            if rating is not None and num_reviews is not None and num_orders is not None:
                 break
         
         # === SHIPPING INFO ===
+        # Only text under shipping/delivery elements; the loose 'day' + digit
+        # test alone would also pick up e.g. "90-Day Buyer Protection"
         shipping_info = []
-        shipping_text = sel.xpath("//*[contains(text(), 'shipping') or contains(text(), 'delivery') or contains(text(), 'days')]//text()").getall()
-        for text in shipping_text:
+        for text in _XP_SHIPPING(root):
             text = text.strip().lower()
             if ('free' in text and 'shipping' in text) or ('day' in text and any(c.isdigit() for c in text)):
                 shipping_info.append(text[:100])  # Limit length
+                if len(shipping_info) == 3:  # Max 3 shipping options
+                    break
         
         # === IMAGES - Get main product images only ===
         main_images = []
-        img_selectors = [
-            "//div[contains(@class, 'image-view')]//img/@src",
-            "//div[contains(@class, 'product-image')]//img/@src", 
-            "//img[contains(@alt, 'product')]/@src"
-        ]
-        for selector in img_selectors:
-            imgs = sel.xpath(selector).getall()
-            for img in imgs[:5]:  # Max 5 images
-                if img.startswith('http') and 'aliexpress' in img:
-                    main_images.append(img)
+        for xp in _XP_IMAGES:
+            main_images.extend(islice(filter(_ALIE_IMG_RE.match, xp(root)), 5))  # Max 5 images
             if main_images:
                 break
         
-        # === PRODUCT ID ===
-        pid = url.split("item/")[-1].split(".")[0]
-        
         # === CREATE PRODUCT OBJECT ===
         product = Product(
             product_title=title,
@@ -163,7 +184,7 @@ async def scrape_product_and_store_sf_improved(sf_cfg: ScrapflyConfig, url: str)
             num_ratings=num_reviews,
             num_orders=num_orders,
             image_urls=main_images[:10],  # Limit to 10 images max
-            shipping_options=[{"info": info} for info in shipping_info[:3]]  # Max 3 shipping options
+            shipping_options=[{"info": info} for info in shipping_info]  # Max 3 shipping options
         )
         
         # === STORE EXTRACTION ===
@@ -171,24 +192,21 @@ async def scrape_product_and_store_sf_improved(sf_cfg: ScrapflyConfig, url: str)
         store_name = "Unknown Store"
         
         # Look for store links
-        store_links = sel.xpath("//a[contains(@href, '/store/') or contains(@href, '/shop/')]/@href").getall()
+        store_links = _XP_STORE_LINKS(root)
         if store_links:
             store_url = store_links[0]
             if not store_url.startswith("http"):
                 store_url = "https://www.aliexpress.com" + store_url
         
         # Extract store name from various places
-        store_name_candidates = [
-            *sel.xpath("//a[contains(@href, '/store/')]//text()").getall(),
-            *sel.xpath("//span[contains(@class, 'store') or contains(@class, 'seller')]//text()").getall(),
-            *sel.xpath("//*[contains(text(), 'Store') or contains(text(), 'Shop')]//text()").getall()
-        ]
+        store_name_candidates = [text for xp in _XP_STORE_NAMES for text in xp(root)]
         
         for candidate in store_name_candidates:
             candidate = candidate.strip()
             if len(candidate) > 3 and len(candidate) < 50 and not candidate.isdigit():
                 # Filter out common non-store text
-                if not any(word in candidate.lower() for word in ['visit', 'store', 'shop', 'view', 'see', 'more']):
+                candidate_low = candidate.lower()
+                if not any(word in candidate_low for word in ['visit', 'store', 'shop', 'view', 'see', 'more']):
                     store_name = candidate
                     break
         
@@ -215,7 +233,7 @@ async def scrape_seller_sf_improved(sf_cfg: ScrapflyConfig, seller_name: str, se
         if res.status_code != 200:
             raise Exception("Failed to load store page")
             
-        sel = Selector(res.content)
+        root = Selector(res.content).root
         
         # Simple, clean extraction
         rating = None
@@ -223,10 +241,8 @@ async def scrape_seller_sf_improved(sf_cfg: ScrapflyConfig, seller_name: str, se
         location = None
         
         # Look for rating (format: 4.8, 95.5%, etc.)
-        rating_text = sel.xpath("//*[contains(text(), '.') and (contains(text(), '%') or contains(., '/5'))]//text()").getall()
-        for text in rating_text[:5]:  # Check first 5 only
-            import re
-            match = re.search(r'(\d+\.?\d*)(?:%|/5)', text)
+        for text in _XP_SELLER_RATING(root):  # First 5 only
+            match = _RATING_VAL_RE.search(text)
             if match:
                 try:
                     rating_val = float(match.group(1))
@@ -239,10 +255,8 @@ async def scrape_seller_sf_improved(sf_cfg: ScrapflyConfig, seller_name: str, se
                     continue
         
         # Look for followers (format: 1,234 followers)
-        followers_text = sel.xpath("//*[contains(text(), 'follow')]//text()").getall()
-        for text in followers_text[:3]:
-            import re
-            match = re.search(r'(\d+(?:,\d+)*)', text)
+        for text in _XP_SELLER_FOLLOWERS(root):
+            match = _NUM_RE.search(text)
             if match:
                 try:
                     followers = int(match.group(1).replace(',', ''))
@@ -251,14 +265,13 @@ async def scrape_seller_sf_improved(sf_cfg: ScrapflyConfig, seller_name: str, se
                     continue
         
         # Look for location
-        location_candidates = sel.xpath("//text()").getall()
+        location_candidates = _XP_ALL_TEXT(root)
         for text in location_candidates:
             text = text.strip()
-            # Look for country/city patterns
-            if any(country in text for country in ['China', 'USA', 'UK', 'Germany', 'Japan']):
-                if len(text) < 50:  # Reasonable location length
-                    location = text
-                    break
+            # Look for country/city patterns within a reasonable location length
+            if len(text) < 50 and _COUNTRY_RE.search(text):
+                location = text
+                break
         
     except Exception:
         rating = None
@@ -5,6 +5,7 @@ import asyncio
 import json
 import random
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import AsyncIterator, Optional
 
@@ -21,6 +22,17 @@ DEFAULT_UAS = [
 ]
 
 
+@lru_cache(maxsize=None)
+def _read_ua_file(path: Path) -> tuple[str, ...]:
+    """Read and parse a UA list file once per path, shared across managers."""
+    content = path.read_text(encoding="utf-8")
+    if path.suffix.lower() == ".json":
+        data = json.loads(content)
+        if isinstance(data, list):
+            return tuple(str(x) for x in data if isinstance(x, (str, int, float)))
+    return tuple(line.strip() for line in content.splitlines() if line.strip())
+
+
 class BrowserManager:
     """High-level manager to own Playwright lifecycle and contexts.
 
@@ -46,19 +58,17 @@ class BrowserManager:
         self._browser: Optional[Browser] = None
         self._logger = get_logger(debug=debug)
         self._uas = self._load_ua_list()
+        self._ua_n = len(self._uas)
 
-    def _load_ua_list(self) -> list[str]:
+    def _load_ua_list(self) -> tuple[str, ...]:
         if self.ua_list_path and self.ua_list_path.exists():
             try:
-                content = self.ua_list_path.read_text(encoding="utf-8")
-                if self.ua_list_path.suffix.lower() == ".json":
-                    data = json.loads(content)
-                    if isinstance(data, list):
-                        return [str(x) for x in data if isinstance(x, (str, int, float))]
-                return [line.strip() for line in content.splitlines() if line.strip()]
+                uas = _read_ua_file(self.ua_list_path)
+                if uas:
+                    return uas
             except Exception as e:
                 self._logger.warning("Failed to load UA list from %s: %s", self.ua_list_path, e)
-        return DEFAULT_UAS[:]
+        return tuple(DEFAULT_UAS)
 
     async def __aenter__(self) -> "BrowserManager":
         self._playwright = await async_playwright().start()
@@ -76,13 +86,14 @@ class BrowserManager:
             if self._playwright:
                 await self._playwright.stop()
 
-    async def new_context(self) -> BrowserContext:
+    async def new_context(self, *, storage_state: Optional[dict] = None) -> BrowserContext:
         assert self._browser is not None
-        ua = random.choice(self._uas)
+        ua = self._uas[random.randrange(self._ua_n)]
         ctx = await self._browser.new_context(
             user_agent=ua,
             viewport={"width": 1366, "height": 900},
             java_script_enabled=True,
+            storage_state=storage_state,
         )
         ctx.set_default_timeout(self.timeout * 1000)
         return ctx
@@ -22,6 +22,9 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--output", type=Path)
     p.add_argument("--csv", type=Path)
     p.add_argument("--limit", type=int, default=20)
+    p.add_argument(
+        "--concurrency", type=int, default=3, help="Max concurrent product page fetches"
+    )
     p.add_argument("--debug", action="store_true")
     # Scrapfly options
     p.add_argument(
@@ -53,6 +56,7 @@ def main(argv: Optional[list[str]] = None) -> int:
         output=args.output,
         csv=args.csv,
         limit=args.limit,
+        concurrency=args.concurrency,
         debug=args.debug,
     ).finalize()
 
@@ -75,6 +79,7 @@ def main(argv: Optional[list[str]] = None) -> int:
             country=args.country,
             key=key,
             cookie=args.aep_cookie,
+            concurrency=cfg.concurrency,
         )
         # Write outputs (applies to both backends)
         if cfg.csv:
@@ -19,20 +19,22 @@ class Config:
         query: Search query string.
         max_suppliers: Max number of unique sellers to scrape.
         max_products_per_seller: Max products per seller from search results.
-    headless: Deprecated (Scrapfly handles rendering).
+        headless: Deprecated (Scrapfly handles rendering).
         output: JSON output path. Defaults to ./aliexpress_{slug}.json
         csv: Optional CSV output path.
-    proxy: Deprecated.
-    timeout: Deprecated.
-    respect_robots: Deprecated.
+        proxy: Deprecated.
+        timeout: Deprecated.
+        respect_robots: Deprecated.
         limit: Number of search listings to scan.
-    download_images: Whether to download images to local folder.
-    concurrency: Deprecated.
-    user_agent_list: Deprecated.
-    retries: Deprecated.
-    backoff_base: Deprecated.
+        download_images: Whether to download images to local folder.
+        concurrency: Max concurrent Scrapfly product fetches. The Playwright
+            scraper also uses it as its page-pool size and as the starting
+            (and maximum) admission limit.
+        user_agent_list: Deprecated.
+        retries: Deprecated.
+        backoff_base: Deprecated.
         debug: Enable extra logging and file log.
-    abort_on_antibot: Deprecated.
+        abort_on_antibot: Deprecated.
     """
 
     query: str
@@ -8,6 +8,11 @@ import logging
 from logging import Logger
 from pathlib import Path
 
+_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s %(levelname)s [%(name)s] %(message)s",
+    datefmt="%Y-%m-%dT%H:%M:%S%z",
+)
+
 
 def get_logger(name: str = "aliexpress_scraper", *, debug: bool = False) -> Logger:
     logger = logging.getLogger(name)
@@ -16,15 +21,12 @@ def get_logger(name: str = "aliexpress_scraper", *, debug: bool = False) -> Logg
 
     level = logging.DEBUG if debug else logging.INFO
     logger.setLevel(level)
-
-    formatter = logging.Formatter(
-        fmt="%(asctime)s %(levelname)s [%(name)s] %(message)s",
-        datefmt="%Y-%m-%dT%H:%M:%S%z",
-    )
+    # Our own handler is attached; don't also walk up to the root logger's
+    logger.propagate = False
 
     ch = logging.StreamHandler()
     ch.setLevel(level)
-    ch.setFormatter(formatter)
+    ch.setFormatter(_FORMATTER)
     logger.addHandler(ch)
 
     # File handler added lazily via add_file_handler
@@ -34,9 +36,5 @@ def get_logger(name: str = "aliexpress_scraper", *, debug: bool = False) -> Logg
 def add_file_handler(logger: Logger, log_path: Path) -> None:
     fh = logging.FileHandler(log_path)
     fh.setLevel(logging.DEBUG)
-    formatter = logging.Formatter(
-        fmt="%(asctime)s %(levelname)s [%(name)s] %(message)s",
-        datefmt="%Y-%m-%dT%H:%M:%S%z",
-    )
-    fh.setFormatter(formatter)
+    fh.setFormatter(_FORMATTER)
     logger.addHandler(fh)
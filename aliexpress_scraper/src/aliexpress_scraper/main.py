@@ -5,8 +5,12 @@ from __future__ import annotations
 Exposes a `Scraper` class used by CLI and programmatic API.
 """
 import asyncio
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import List
+from typing import AsyncIterator, List
+
+from playwright.async_api import BrowserContext, Page
 
 from .browser_manager import BrowserManager
 from .config import Config
@@ -17,7 +21,92 @@ from .output import download_images
 from .product import scrape_product
 from .search import discover_sellers
 from .seller import scrape_seller
-from .utils import check_robots_txt, exponential_backoff_retry, random_sleep
+from .utils import check_robots_txt, exponential_backoff_retry
+
+# Recycle the browser context after this many page uses; Playwright keeps
+# request/response bookkeeping on the context until it is closed.
+PAGE_ROTATE_EVERY = 50
+
+_ROBOTS_PROBE_URL = "https://www.aliexpress.com/wholesale?SearchText=test"
+
+
+class AdmissionController:
+    """Counter guarded by a Condition; caps in-flight scrapes at a tunable limit."""
+
+    def __init__(self, limit: int) -> None:
+        self._active = 0
+        self._cmax = max(1, limit)
+        self._cond = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return self._cmax
+
+    async def set_limit(self, n: int) -> None:
+        """Change the cap at runtime and wake waiters so they re-check it."""
+        async with self._cond:
+            self._cmax = max(1, n)
+            self._cond.notify_all()
+
+    async def __aenter__(self) -> "AdmissionController":
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self._cmax)
+            self._active += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+
+class AdaptiveTokenBucket:
+    """Token bucket whose refill rate backs off on failure and creeps up on success.
+
+    Halving on anti-bot hits and adding `step` per success (AIMD) lets the
+    request rate settle near what the site tolerates.
+    """
+
+    def __init__(
+        self,
+        rate: float = 2.0,
+        min_rate: float = 0.2,
+        max_rate: float = 10.0,
+        step: float = 0.1,
+    ) -> None:
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.step = step
+        self._tokens = 1.0
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(1.0, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+    def on_success(self) -> None:
+        self.rate = min(self.rate + self.step, self.max_rate)
+
+    def on_failure(self) -> None:
+        self.rate = max(self.rate / 2, self.min_rate)
+
+
+async def _cancel_all(tasks: List[asyncio.Task]) -> None:
+    """Cancel unfinished tasks and wait for them to unwind (releasing pages)."""
+    for t in tasks:
+        if not t.done():
+            t.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
 
 
 class Scraper:
@@ -27,7 +116,13 @@ class Scraper:
         self.cfg = config
         self.logger = get_logger(debug=config.debug)
         self._bm: BrowserManager | None = None
-        self._sem = asyncio.Semaphore(self.cfg.concurrency)
+        self._admission = AdmissionController(self.cfg.concurrency)
+        self._atb = AdaptiveTokenBucket()
+        self._pool_size = max(1, self.cfg.concurrency)
+        self._page_pool: asyncio.Queue[Page] = asyncio.Queue()
+        self._ctx: BrowserContext | None = None
+        self._pages_used = 0
+        self._rotate_lock = asyncio.Lock()
 
     async def __aenter__(self) -> "Scraper":
         self._bm = BrowserManager(
@@ -38,29 +133,106 @@ class Scraper:
             debug=self.cfg.debug,
         )
         await self._bm.__aenter__()
+        await self._open_pool()
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
-        if self._bm:
-            await self._bm.__aexit__(exc_type, exc, tb)
+        try:
+            if self._ctx:
+                await self._ctx.close()
+        finally:
+            if self._bm:
+                await self._bm.__aexit__(exc_type, exc, tb)
+
+    async def _open_pool(self, storage_state: dict | None = None) -> None:
+        """Create a fresh context and fill the pool with its pages."""
+        assert self._bm is not None
+        self._ctx = await self._bm.new_context(storage_state=storage_state)
+        for _ in range(self._pool_size):
+            self._page_pool.put_nowait(await self._ctx.new_page())
+
+    async def _rotate_context(self) -> None:
+        """Wait for every pooled page to come back, then swap in a new context.
+
+        The new context is built before the old one is closed; if that fails
+        the old pages go back into the pool, so later `_page()` calls never
+        wait on an empty queue.
+        """
+        assert self._bm is not None and self._ctx is not None
+        old = self._ctx
+        pages = [await self._page_pool.get() for _ in range(self._pool_size)]
+        ctx: BrowserContext | None = None
+        try:
+            state = await old.storage_state()
+            ctx = await self._bm.new_context(storage_state=state)  # type: ignore[arg-type]
+            fresh = [await ctx.new_page() for _ in range(self._pool_size)]
+        except BaseException:
+            if ctx is not None:
+                try:
+                    await ctx.close()
+                except Exception:
+                    pass  # keep the original error
+            for page in pages:
+                self._page_pool.put_nowait(page)
+            raise
+        finally:
+            self._pages_used = 0
+        self._ctx = ctx
+        for page in fresh:
+            self._page_pool.put_nowait(page)
+        try:
+            await old.close()
+        except Exception as e:
+            self.logger.warning("Closing the previous browser context failed: %s", e)
+
+    @asynccontextmanager
+    async def _page(self) -> AsyncIterator[Page]:
+        """Borrow a pooled page for one navigation and hand it back afterwards."""
+        async with self._rotate_lock:
+            if self._pages_used >= PAGE_ROTATE_EVERY:
+                await self._rotate_context()
+            self._pages_used += 1
+        page = await self._page_pool.get()
+        try:
+            yield page
+        finally:
+            # A crashed or closed page would be handed out again until the next rotation
+            if page.is_closed():
+                assert self._ctx is not None
+                page = await self._ctx.new_page()
+            self._page_pool.put_nowait(page)
+
+    @asynccontextmanager
+    async def _slot(self) -> AsyncIterator[Page]:
+        """Rate-limited, admission-gated page; anti-bot hits throttle both."""
+        await self._atb.acquire()
+        async with self._admission, self._page() as page:
+            try:
+                yield page
+            except AntiBotDetected:
+                self._atb.on_failure()
+                await self._admission.set_limit(self._admission.limit // 2)
+                raise
+            self._atb.on_success()
+            if self._admission.limit < self.cfg.concurrency:
+                await self._admission.set_limit(self._admission.limit + 1)
 
     async def run(self) -> ScrapeResult:
         assert self._bm is not None
-        page = await self._bm.new_page()
 
         # Respect robots if requested
         if self.cfg.respect_robots:
-            start_url = "https://www.aliexpress.com/wholesale?SearchText=test"
-            if not check_robots_txt(start_url):
+            if not await asyncio.to_thread(check_robots_txt, _ROBOTS_PROBE_URL):
                 raise RobotsDisallowed("Robots.txt disallows scraping search page")
 
         try:
-            sellers_info = await discover_sellers(
-                page,
-                self.cfg.query,
-                limit=self.cfg.limit,
-                max_suppliers=self.cfg.max_suppliers,
-            )
+            async with self._page() as page:
+                sellers_info = await discover_sellers(
+                    page,
+                    self.cfg.query,
+                    limit=self.cfg.limit,
+                    max_suppliers=self.cfg.max_suppliers,
+                )
         except AntiBotDetected as e:
             if self.cfg.abort_on_antibot:
                 raise
@@ -70,9 +242,7 @@ class Scraper:
         result = ScrapeResult(query=self.cfg.query)
 
         async def handle_seller(seller_name: str, seller_url: str, product_urls: List[str]) -> None:
-            await random_sleep(0.2, 0.8)
-            p = await self._bm.new_page()  # type: ignore[union-attr]
-            async with self._sem:
+            async with self._slot() as p:
                 seller = await scrape_seller(p, seller_name, seller_url)
             if not seller:
                 return
@@ -80,19 +250,29 @@ class Scraper:
             # Limit products per seller
             urls = product_urls[: self.cfg.max_products_per_seller]
 
-            async def handle_product(url: str) -> Product | None:
-                await random_sleep(0.2, 0.8)
-                pg = await self._bm.new_page()  # type: ignore[union-attr]
-                async with self._sem:
-                    prod = await scrape_product(pg, url)
-                return prod
+            # Slot i holds urls[i]'s product, so the list keeps search order
+            products: List[Product | None] = [None] * len(urls)
 
-            prods = await asyncio.gather(*[handle_product(u) for u in urls], return_exceptions=True)
-            for pr in prods:
-                if isinstance(pr, Exception):
-                    self.logger.warning("Product scrape failed: %s", pr)
-                elif pr:
-                    seller.products.append(pr)
+            async def handle_product(i: int, url: str) -> None:
+                async with self._slot() as pg:
+                    products[i] = await scrape_product(pg, url)
+
+            # Handle failures as they finish, so an anti-bot abort doesn't wait on slower siblings
+            tasks = [asyncio.create_task(handle_product(i, u)) for i, u in enumerate(urls)]
+            try:
+                for fut in asyncio.as_completed(tasks):
+                    try:
+                        await fut
+                    except AntiBotDetected:
+                        if self.cfg.abort_on_antibot:
+                            raise
+                        self.logger.warning("Anti-bot detected on product (skipping)")
+                    except Exception as e:
+                        self.logger.warning("Product scrape failed: %s", e)
+            finally:
+                # On abort, stop sibling scrapes instead of letting them hold pages
+                await _cancel_all(tasks)
+            seller.products.extend(pr for pr in products if pr)
 
             result.suppliers.append(seller)
 
@@ -104,9 +284,25 @@ class Scraper:
                     raise
                 self.logger.warning("Anti-bot detected for seller %s: %s (skipping)", u, e)
 
-        await asyncio.gather(*(safe_handle_seller(n, u, ps) for (n, u, ps) in sellers_info), return_exceptions=False)
+        # A fixed pool of workers pulls sellers in search order: only O(concurrency)
+        # seller tasks exist at once, and a slow seller holds up just its own worker
+        # (_slot() still bounds the pages in flight)
+        pending = iter(sellers_info)
+
+        async def seller_worker() -> None:
+            for n, u, ps in pending:
+                await safe_handle_seller(n, u, ps)
+
+        workers = [
+            asyncio.create_task(seller_worker())
+            for _ in range(min(max(1, self.cfg.concurrency), len(sellers_info)))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            await _cancel_all(workers)
 
         if self.cfg.download_images:
-            download_images(Path("images"), result.suppliers)
+            await asyncio.to_thread(download_images, Path("images"), result.suppliers)
 
         return result
@@ -45,7 +45,7 @@ from typing import Any, Dict, List, Optional
 from .utils import iso_now
 
 
-@dataclass
+@dataclass(slots=True)
 class Product:
     product_title: str
     product_url: str
@@ -70,7 +70,7 @@ class Product:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Seller:
     seller_name: str
     seller_url: str
@@ -88,7 +88,7 @@ class Seller:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapeResult:
     query: str
     scrape_time: str = field(default_factory=iso_now)
@@ -2,11 +2,25 @@ from __future__ import annotations
 
 """Output writers for JSON/CSV and optional image downloading."""
 import csv
+import hashlib
 import json
+import tempfile
+import threading
+from itertools import count
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson  # type: ignore
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - optional
+    _HAS_ORJSON = False
 
 from .logger import get_logger
 from .models import Product, ScrapeResult, Seller
@@ -14,9 +28,48 @@ from .utils import slugify
 
 
 def write_json(path: Path, result: ScrapeResult) -> None:
+    """Write the result as indented JSON.
+
+    Uses orjson's native dataclass support when installed; otherwise streams
+    one seller at a time with the stdlib encoder.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
+    if _HAS_ORJSON:
+        path.write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+        return
+
+    def dumps(obj: object) -> str:
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+
     with path.open("w", encoding="utf-8") as f:
-        json.dump(result.to_dict(), f, ensure_ascii=False, indent=2)
+        f.write(f'{{\n  "query": {dumps(result.query)},\n  "scrape_time": {dumps(result.scrape_time)},\n')
+        if not result.suppliers:
+            f.write('  "suppliers": []\n}')
+            return
+        f.write('  "suppliers": [')
+        for i, s in enumerate(result.suppliers):
+            f.write(",\n    " if i else "\n    ")
+            f.write(dumps(s.to_dict()).replace("\n", "\n    "))
+        f.write("\n  ]\n}")
+
+
+_CSV_PRODUCT_FIELDS = attrgetter(
+    "product_title",
+    "product_url",
+    "product_id",
+    "price",
+    "currency",
+    "rating",
+    "num_ratings",
+    "num_orders",
+)
+
+
+def _iter_csv_rows(result: ScrapeResult) -> Iterator[tuple]:
+    for s in result.suppliers:
+        for p in s.products:
+            title, url, pid, *rest = _CSV_PRODUCT_FIELDS(p)
+            yield (s.seller_name, s.seller_url, title, url, pid, *(v or "" for v in rest))
 
 
 def write_csv(path: Path, result: ScrapeResult) -> None:
@@ -34,44 +87,94 @@ def write_csv(path: Path, result: ScrapeResult) -> None:
         "num_orders",
     ]
     with path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fields)
-        w.writeheader()
-        for s in result.suppliers:
-            for p in s.products:
-                w.writerow({
-                    "seller_name": s.seller_name,
-                    "seller_url": s.seller_url,
-                    "product_title": p.product_title,
-                    "product_url": p.product_url,
-                    "product_id": p.product_id,
-                    "price": p.price or "",
-                    "currency": p.currency or "",
-                    "rating": p.rating or "",
-                    "num_ratings": p.num_ratings or "",
-                    "num_orders": p.num_orders or "",
-                })
+        w = csv.writer(f)
+        w.writerow(fields)
+        w.writerows(_iter_csv_rows(result))
+
+
+IMAGE_WORKERS = 16
+
+
+def _download_one(
+    sess: requests.Session,
+    fpath: Path,
+    url: str,
+    seen: dict[tuple[Path, str], str],
+    lock: threading.Lock,
+) -> Optional[str]:
+    """Stream one image to disk; returns the local path or None on failure.
+
+    Images are hashed while streaming; a body already saved in the same seller
+    folder is discarded and the earlier file's path returned instead. `fpath`
+    must belong to this job alone (download_images guarantees it), and a hash
+    is only recorded once its file is in place.
+    """
+    tmp: Optional[Path] = None
+    try:
+        h = hashlib.sha1()
+        with sess.get(url, timeout=15, stream=True) as r:
+            r.raise_for_status()
+            # Unique temp name: concurrent jobs never share a partial file
+            with tempfile.NamedTemporaryFile(
+                dir=fpath.parent, prefix=f".{fpath.stem}-", suffix=".tmp", delete=False
+            ) as f:
+                tmp = Path(f.name)
+                for chunk in r.iter_content(65536):
+                    h.update(chunk)
+                    f.write(chunk)
+        key = (fpath.parent, h.hexdigest())
+        with lock:
+            existing = seen.get(key)
+            if existing is None:
+                tmp.replace(fpath)
+                seen[key] = str(fpath)
+                return str(fpath)
+        tmp.unlink()
+        return existing
+    except Exception as e:
+        if tmp is not None:
+            tmp.unlink(missing_ok=True)
+        get_logger().warning("Failed to download image %s: %s", url, e)
+        return None
 
 
 def download_images(base_dir: Path, sellers: Iterable[Seller]) -> None:
-    logger = get_logger()
+    jobs: List[Tuple[Product, Path, str]] = []
+    taken: set[Path] = set()
     for s in sellers:
         seller_dir = base_dir / slugify(s.seller_name)
         seller_dir.mkdir(parents=True, exist_ok=True)
-        for p in s.products:
-            local_paths: List[str] = []
+        for pidx, p in enumerate(s.products):
+            stem = slugify(p.product_id or "image")
+            if seller_dir / stem in taken:
+                # No id, a repeated id, or two sellers slugging to one folder:
+                # suffix the product's index so every job owns its files
+                base = stem
+                stem = next(
+                    c for c in (f"{base}-{n}" for n in count(pidx)) if seller_dir / c not in taken
+                )
+            taken.add(seller_dir / stem)
             for idx, url in enumerate(p.image_urls[:10]):
-                try:
-                    r = requests.get(url, timeout=15)
-                    r.raise_for_status()
-                    ext = ".jpg"
-                    fname = f"{slugify(p.product_id or str(idx))}{ext}"
-                    fpath = seller_dir / fname
-                    fpath.write_bytes(r.content)
-                    local_paths.append(str(fpath))
-                except Exception as e:
-                    logger.warning("Failed to download image %s: %s", url, e)
-            if local_paths:
-                p.image_urls = local_paths
+                jobs.append((p, seller_dir / f"{stem}_{idx}.jpg", url))
+    if not jobs:
+        return
+
+    sess = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+    sess.mount("https://", adapter)
+    sess.mount("http://", adapter)
+    with sess, ThreadPoolExecutor(max_workers=IMAGE_WORKERS) as pool:
+        seen: dict[tuple[Path, str], str] = {}
+        lock = threading.Lock()
+        paths = list(pool.map(lambda j: _download_one(sess, j[1], j[2], seen, lock), jobs))
+
+    local: dict[int, List[str]] = {}
+    for (p, _, _), path in zip(jobs, paths):
+        if path:
+            local.setdefault(id(p), []).append(path)
+    for p, _, _ in jobs:
+        if id(p) in local:
+            p.image_urls = list(dict.fromkeys(local[id(p)]))
 
 
 def print_summary(result: ScrapeResult) -> None:
@@ -5,35 +5,74 @@ from __future__ import annotations
 Pure functions for testability. These don't call the network.
 """
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Union
 
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml.cssselect import CSSSelector
+from lxml.etree import ParserError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from bs4 import BeautifulSoup
 
 
 PRODUCT_ID_REGEX = re.compile(r"(?:/item/|item/)(\d{10,})")
+PRICE_REGEX = re.compile(r"\d[\d,]*(?:\.\d+)?")
+ANTIBOT_REGEX = re.compile(
+    r"captcha|verify you are human|cloudflare|attention required|unusual traffic",
+    re.IGNORECASE,
+)
+# Leading <?xml ...?> declaration (XHTML); lxml rejects str input that declares an encoding
+XML_DECL_REGEX = re.compile(r"\s*<\?xml[^>]*\?>")
 
 
+@lru_cache(maxsize=4096)
 def parse_product_id(url: str) -> Optional[str]:
     """Extract product ID from common AliExpress URL formats."""
     m = PRODUCT_ID_REGEX.search(url)
     return m.group(1) if m else None
 
 
-def parse_text(soup: BeautifulSoup, selector: str) -> Optional[str]:
-    el = soup.select_one(selector)
-    if not el:
+@lru_cache(maxsize=4096)
+def parse_price(text: str) -> Optional[float]:
+    """First amount in a price string, ignoring currency marks and thousands commas.
+
+    "AU $1,299.50" -> 1299.5; "US $1.99 - 3.99" -> 1.99; no digits -> None.
+    """
+    m = PRICE_REGEX.search(text)
+    return float(m.group(0).replace(",", "")) if m else None
+
+
+@lru_cache(maxsize=256)
+def _css(selector: str) -> CSSSelector:
+    return CSSSelector(selector)
+
+
+def parse_text(doc: Union[str, "BeautifulSoup"], selector: str) -> Optional[str]:
+    """Text of the first element matching `selector`, whitespace-joined and stripped.
+
+    `doc` is raw HTML (parsed with lxml); an already-built BeautifulSoup is
+    still accepted for older callers.
+    """
+    if not isinstance(doc, str):
+        el = doc.select_one(selector)
+        if not el:
+            return None
+        text = el.get_text(" ", strip=True)
+        return text or None
+    m = XML_DECL_REGEX.match(doc)
+    if m:
+        doc = doc[m.end():]
+    try:
+        root = lxml.html.fromstring(doc)
+    except ParserError:
+        return None
+    found = _css(selector)(root)
+    if not found:
         return None
-    text = el.get_text(" ", strip=True)
+    text = " ".join(t for t in (s.strip() for s in found[0].itertext()) if t)
     return text or None
 
 
 def detect_antibot(html: str) -> bool:
-    html_lower = html.lower()
-    indicators = [
-        "captcha",
-        "verify you are human",
-        "cloudflare",
-        "attention required",
-        "unusual traffic",
-    ]
-    return any(ind in html_lower for ind in indicators)
+    return ANTIBOT_REGEX.search(html) is not None
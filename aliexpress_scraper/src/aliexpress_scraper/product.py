@@ -2,6 +2,8 @@ from __future__ import annotations
 
 """Product-level scraping and parsing."""
 import asyncio
+import random
+import re
 from typing import Optional
 
 from playwright.async_api import Page, Error as PWError
@@ -11,44 +13,100 @@ from .models import Product
 from .parsers import detect_antibot, parse_product_id
 from .utils import random_sleep
 
+_INT_RE = re.compile(r"\d+")
+_NUM_RE = re.compile(r"[\d.]+")
+
+# Candidate selectors per field, tried in order
+_SELECTORS = {
+    "title": ["h1.product-title-text", "h1", "title"],
+    "price": [
+        ".product-price-value",
+        "span#j-sku-price",
+        "span#j-sku-price2",
+        "meta[itemprop='price']",
+    ],
+    "rating": ["span.product-reviewer-satisfaction", "span.overview-rating-average"],
+    "num_ratings": ["span.product-reviewer-reviews", "span#j-cnt-review"],
+    "num_orders": ["span.product-reviewer-sold", "span#j-order-num"],
+}
+
+# Runs in the page: first matching selector wins, preferring a `content`
+# attribute (meta tags) over the element's trimmed text.
+_EXTRACT_JS = """
+(sel) => {
+  const first = (list) => {
+    for (const s of list) {
+      const el = document.querySelector(s);
+      if (!el) continue;
+      const content = el.getAttribute("content");
+      if (content) return content;
+      const text = (el.innerText || "").trim();
+      if (text) return text;
+    }
+    return null;
+  };
+  // Unique http(s) image URLs, skipping 1x1 trackers and loaded images <= 100px
+  // wide; capped at the number output.download_images will fetch anyway.
+  const images = () => {
+    const seen = new Set();
+    for (const e of document.images) {
+      const s = e.currentSrc || e.src;
+      if (!s || !s.startsWith("http") || s.includes("1x1")) continue;
+      if (e.complete && e.naturalWidth > 0 && e.naturalWidth <= 100) continue;
+      seen.add(s);
+      if (seen.size >= 10) break;
+    }
+    return Array.from(seen);
+  };
+  const cur = document.querySelector("meta[itemprop='priceCurrency']");
+  return {
+    title: first(sel.title),
+    price: first(sel.price),
+    currency: cur ? cur.getAttribute("content") : null,
+    rating: first(sel.rating),
+    num_ratings: first(sel.num_ratings),
+    num_orders: first(sel.num_orders),
+    images: images(),
+  };
+}
+"""
+
 
 async def scrape_product(page: Page, url: str) -> Optional[Product]:
     # Retry navigation
     delay = 0.8
     for attempt in range(3):
         try:
-            await page.goto(url, wait_until="domcontentloaded")
-            break
+            resp = await page.goto(url, wait_until="domcontentloaded")
         except PWError:
             if attempt == 2:
                 raise
-            await asyncio.sleep(delay)
-            delay *= 1.8
+            # Jitter so concurrent workers don't retry in lockstep
+            await asyncio.sleep(delay * random.uniform(0.7, 1.3))
+            delay = min(delay * 1.8, 30)
+            continue
+        if resp is not None and resp.status == 429 and attempt < 2:
+            await asyncio.sleep(_retry_after(resp.headers.get("retry-after"), delay) + random.random() * 0.25)
+            delay = min(delay * 1.8, 30)
+            continue
+        break
     html = await page.content()
     if detect_antibot(html):
         raise AntiBotDetected("Anti-bot page detected on product")
 
     pid = parse_product_id(url) or ""
 
-    # Try grabbing title and price with common selectors
-    title = await _first_text(page, ["h1.product-title-text", "h1", "title"]) or ""
-    price = await _first_text(page, [
-        ".product-price-value",
-        "span#j-sku-price",
-        "span#j-sku-price2",
-        "meta[itemprop='price']",
-    ])
-    currency = await page.get_attribute("meta[itemprop='priceCurrency']", "content")
+    # Pull every field in one round-trip instead of one query per selector
+    data = await page.evaluate(_EXTRACT_JS, _SELECTORS)
+    title = data["title"] or ""
+    price = data["price"]
+    currency = data["currency"]
 
     # Best-effort counts
-    rating = await _first_number(page, ["span.product-reviewer-satisfaction", "span.overview-rating-average"])  # type: ignore[assignment]
-    num_ratings = await _first_int(page, ["span.product-reviewer-reviews", "span#j-cnt-review"])  # type: ignore[assignment]
-    num_orders = await _first_int(page, ["span.product-reviewer-sold", "span#j-order-num"])  # type: ignore[assignment]
-
-    imgs = await page.eval_on_selector_all(
-        "img",
-        "els => Array.from(els).map(e => e.src).filter(s => s && s.startsWith('http'))",
-    )
+    rating = _to_number(data["rating"])
+    num_ratings = _to_int(data["num_ratings"])
+    num_orders = _to_int(data["num_orders"])
+    imgs = data["images"]
 
     p = Product(
         product_title=title,
@@ -65,34 +123,30 @@ async def scrape_product(page: Page, url: str) -> Optional[Product]:
     return p
 
 
-async def _first_text(page: Page, selectors: list[str]) -> Optional[str]:
-    for sel in selectors:
-        el = await page.query_selector(sel)
-        if el:
-            # Some price selectors use content attribute
-            content = await el.get_attribute("content")
-            if content:
-                return content
-            text = (await el.inner_text()).strip()
-            if text:
-                return text
-    return None
+def _retry_after(value: Optional[str], default: float) -> float:
+    """Seconds from a Retry-After header (delta form only), capped at 30s."""
+    try:
+        return min(max(float(value), 0.0), 30.0) if value else default
+    except ValueError:
+        return default
 
 
-async def _first_int(page: Page, selectors: list[str]) -> Optional[int]:
-    t = await _first_text(page, selectors)
+def _to_int(t: Optional[str]) -> Optional[int]:
     if not t:
         return None
-    digits = "".join(ch for ch in t if ch.isdigit())
+    if t.isdecimal():  # plain digits: skip the regex
+        return int(t)
+    digits = "".join(_INT_RE.findall(t))
     return int(digits) if digits else None
 
 
-async def _first_number(page: Page, selectors: list[str]) -> Optional[float]:
-    t = await _first_text(page, selectors)
+def _to_number(t: Optional[str]) -> Optional[float]:
     if not t:
         return None
     t = t.replace(",", ".")
-    num = "".join(ch for ch in t if (ch.isdigit() or ch == "."))
+    if t.replace(".", "", 1).isdecimal():  # plain "123" / "4.7": skip the regex
+        return float(t)
+    num = "".join(_NUM_RE.findall(t))
     try:
         return float(num)
     except Exception:
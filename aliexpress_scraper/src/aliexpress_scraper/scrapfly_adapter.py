@@ -9,10 +9,18 @@ and simple seller info via the Scrapfly API. This is optional; install extras:
 
 and provide an API key via Config.scrapfly_key or SCRAPFLY_KEY env.
 """
+import asyncio
+import atexit
 import json
 import re
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, DefaultDict, Dict, Iterator, List, Optional, Tuple
+
+from lxml import etree
+from lxml.etree import XPath
 
 from .exceptions import ScraperError
 from .logger import get_logger
@@ -20,7 +28,171 @@ from .models import Product, ScrapeResult, Seller
 from .utils import random_sleep
 
 
-_INIT_DATA_RE = re.compile(r"_init_data_\s*=\s*{\s*data:\s*({.+}) }", re.S)
+# Anchored prefix of `_init_data_ = { data: {...} }`; the JSON itself is read
+# with raw_decode so no regex has to scan (or backtrack over) the payload
+_INIT_DATA_HEAD_RE = re.compile(r"_init_data_\s*=\s*{\s*data:\s*(?={)")
+_JSON_DECODER = json.JSONDecoder()
+
+def _compile_each(*patterns: str, flags: int = 0) -> Tuple[re.Pattern[str], ...]:
+    """Compile single-group patterns, kept separate and in priority order."""
+    compiled = tuple(re.compile(p, flags) for p in patterns)
+    assert all(c.groups == 1 for c in compiled), patterns
+    return compiled
+
+
+def _any_of(patterns: Tuple[re.Pattern[str], ...]) -> re.Pattern[str]:
+    """One alternation that only locates where *some* pattern matches (see _scan_nodes)."""
+    return re.compile("|".join(f"(?:{p.pattern})" for p in patterns), patterns[0].flags)
+
+
+def _by_priority(
+    patterns: Tuple[re.Pattern[str], ...], text: str, *, first_only: bool = False
+) -> Iterator[str]:
+    """Captured values, every match of pattern 0 before any of pattern 1, and so on.
+
+    With `first_only` each pattern contributes its first match only (a
+    per-pattern `search`). The patterns are deliberately not fused into one
+    alternation: there an earlier match consumes text that an overlapping,
+    higher-priority match needs.
+    """
+    for pattern in patterns:
+        if first_only:
+            m = pattern.search(text)
+            if m:
+                yield m.group(1)
+        else:
+            for m in pattern.finditer(text):
+                yield m.group(1)
+
+
+# Product page extraction patterns; order within a group is priority
+_TITLE_JSON_PATTERNS = _compile_each(
+    r'"title":\s*"([^"]+)"',
+    r'"productTitle":\s*"([^"]+)"',
+    r'"displayTitle":\s*"([^"]+)"',
+)
+_PRICE_JSON_PATTERNS = _compile_each(
+    r'"formattedPrice":\s*"([^"]+)"',
+    r'"salePrice":\s*{\s*[^}]*"formattedPrice":\s*"([^"]+)"',
+    r'"minPrice":\s*([0-9]+\.?[0-9]*)',
+    r'"price":\s*"([^"]+)"',
+    r'"currentPrice":\s*"([^"]+)"',
+)
+_PRICE_TEXT_PATTERNS = _compile_each(
+    r'AU\s*\$\s*(\d+\.?\d*)',
+    r'USD\s*\$?\s*(\d+\.?\d*)',
+    r'\$\s*(\d+\.?\d*)',
+    r'(\d+\.?\d*)\s*AUD',
+    r'(\d+\.?\d*)\s*USD',
+    flags=re.IGNORECASE,
+)
+_AU_PRICE_RE = re.compile(r'(AU\s*)?[\$]\s*(\d+[\.,]?\d*)')
+# Matched against lowercased text; the *_ANY unions only locate candidate nodes
+_RATING_PATTERNS = _compile_each(
+    r'(\d\.\d)\s*(?:star|rating)',
+    r'rating["\s:]*(\d\.\d)',
+    r'(\d\.\d)\s*out\s*of\s*5',
+)
+_RATING_ANY = _any_of(_RATING_PATTERNS)
+_REVIEW_PATTERNS = _compile_each(
+    r'(\d+(?:,\d+)*)\s*(?:review|rating)',
+    r'(\d+(?:,\d+)*)\s*people\s*rated',
+    r'based\s*on\s*(\d+(?:,\d+)*)',
+)
+_REVIEW_ANY = _any_of(_REVIEW_PATTERNS)
+_ORDER_PATTERNS = _compile_each(
+    r'(\d+(?:,\d+)*(?:\.\d+)?[k]?)\s*(?:sold|order|piece)',
+    r'(\d+(?:,\d+)*)\s*people\s*bought',
+    r'(\d+(?:,\d+)*)\+?\s*sold',
+)
+_ORDER_ANY = _any_of(_ORDER_PATTERNS)
+_STORE_ID_PATTERNS = _compile_each(
+    r'"sellerId":\s*"?(\d+)"?',
+    r'"storeNum":\s*"?(\d+)"?',
+    r'store/(\d+)',
+    r'seller.*?(\d{10,})',  # Look for long seller IDs
+)
+_STORE_NAME_PATTERNS = _compile_each(
+    r'"storeName":\s*"([^"]+)"',
+    r'"sellerName":\s*"([^"]+)"',
+    r'"companyName":\s*"([^"]+)"',
+)
+# Shared parser; dropping blank text and comments shrinks the tree every XPath walks
+_HTML_PARSER = etree.HTMLParser(
+    recover=True, huge_tree=True, remove_blank_text=True, remove_comments=True, encoding="utf-8"
+)
+
+
+def _html_root(content: str) -> etree._Element:
+    """Parse a Scrapfly response body straight into an lxml tree (no parsel Selector)."""
+    body = content.strip().replace("\x00", "").encode("utf-8") or b"<html/>"
+    root = etree.fromstring(body, parser=_HTML_PARSER)
+    return root if root is not None else etree.fromstring(b"<html/>", parser=_HTML_PARSER)
+
+
+# Precompiled XPath; evaluated on the lxml root from _html_root() and returning plain str
+_XP_SCRIPT_TEXT = XPath("//script//text()", smart_strings=False)
+_XP_ALL_TEXT = XPath("//text()", smart_strings=False)
+_XP_TITLE = tuple(
+    XPath(x, smart_strings=False)
+    for x in (
+        "//h1[@data-pl]//text()",
+        "//h1//text()",
+        "//title//text()",
+        "//*[contains(@class, 'product-title')]//text()",
+        "//*[@data-role='product-title']//text()",
+    )
+)
+_XP_PRICE = tuple(
+    XPath(x, smart_strings=False)
+    for x in (
+        "//span[contains(@class,'price-current')]//text()",
+        "//span[contains(@class,'price-now')]//text()",
+        "//div[contains(@class,'price')]//span//text()",
+        "//*[contains(@class,'price') and contains(@class,'sale')]//text()",
+        "//*[contains(@class,'current-price')]//text()",
+        "//*[@data-spm-anchor-id]//span[contains(text(),'$')]//text()",
+    )
+)
+_XP_META_PRICE = XPath("//meta[@property='product:price:amount']/@content", smart_strings=False)
+_XP_META_CURRENCY = XPath("//meta[@property='product:price:currency']/@content", smart_strings=False)
+_XP_SHIPPING_TEXT = XPath(
+    "//*[contains(text(), 'shipping') or contains(text(), 'delivery') or contains(text(), 'days')]//text()",
+    smart_strings=False,
+)
+_XP_IMAGES = tuple(
+    XPath(x, smart_strings=False)
+    for x in (
+        "//div[contains(@class, 'image-view')]//img/@src",
+        "//div[contains(@class, 'product-image')]//img/@src",
+        "//img[contains(@alt, 'product')]/@src",
+    )
+)
+_XP_STORE_LINKS = XPath("//a[contains(@href, '/store/')]/@href", smart_strings=False)
+_XP_STORE_LINK_TEXT = XPath("//a[contains(@href, '/store/')]//text()", smart_strings=False)
+_XP_SELLER_TEXT = XPath(
+    "//*[contains(@class, 'seller') or contains(@class, 'store')]//text()", smart_strings=False
+)
+_XP_SELLER_RATING_TEXT = XPath(
+    "//*[contains(text(), '.') and (contains(text(), '%') or contains(., '/5'))]//text()",
+    smart_strings=False,
+)
+_XP_FOLLOWERS_TEXT = XPath("//*[contains(text(), 'follow')]//text()", smart_strings=False)
+
+_STORE_URL_ID_RE = re.compile(r'/store/(\d+)')
+_HAS_DIGIT = re.compile(r'\d').search
+# Substring blacklists for title / store-name candidates (any position, any case)
+_TITLE_SKIP_RE = re.compile(r'aliexpress|buy|cheap|global', re.IGNORECASE)
+_STORE_SKIP_RE = re.compile(
+    r'visit|store|shop|view|see|more|google|play|app|download|install|mobile|click|link|url',
+    re.IGNORECASE,
+)
+
+# Store page patterns
+_SELLER_RATING_RE = re.compile(r'(\d+\.?\d*)(?:%|/5)')
+_FOLLOWERS_RE = re.compile(r'(\d+(?:,\d+)*)')
+_COUNTRY_RE = re.compile(r'China|USA|UK|Germany|Japan')
+LOCATION_SCAN_NODES = 500
 
 
 @dataclass
@@ -30,15 +202,103 @@ class ScrapflyConfig:
     cookie: Optional[str] = None  # e.g., aep_usuc_f=...
 
 
+def _parse_init_data(html: str) -> Optional[Dict]:
+    """Decode the JSON object assigned to `_init_data_.data` in a search page, if present."""
+    pos = html.find("_init_data_")
+    while pos != -1:
+        m = _INIT_DATA_HEAD_RE.match(html, pos)
+        if m:
+            return _JSON_DECODER.raw_decode(html, m.end())[0]
+        pos = html.find("_init_data_", pos + 1)
+    return None
+
+
+def _scan_nodes(
+    patterns: Tuple[re.Pattern[str], ...],
+    locator: re.Pattern[str],
+    doc: str,
+    convert: Callable[[str], Any],
+) -> Any:
+    """First truthy converted match from NUL-separated text nodes, in node order.
+
+    `locator` (the patterns' _any_of union) only finds the next node with some
+    match; inside that node the patterns are tried one by one, in priority
+    order. A node whose first convertible match is falsy (e.g. "0 sold")
+    doesn't stop the scan, mirroring the per-node loops this replaces.
+    """
+    result = None
+    pos = 0
+    while True:
+        m = locator.search(doc, pos)
+        if not m:
+            return result
+        start = doc.rfind("\x00", 0, m.start()) + 1
+        end = doc.find("\x00", m.end())
+        if end == -1:
+            end = len(doc)
+        for value in _by_priority(patterns, doc[start:end], first_only=True):
+            try:
+                result = convert(value)
+                break
+            except ValueError:
+                continue
+        if result:
+            return result
+        pos = end + 1
+
+
+def _sold_count(value: str) -> int:
+    """'5.2k' -> 5200, '1,234' -> 1234 (value is already lowercase)."""
+    sold_str = value.replace(',', '')
+    if 'k' in sold_str:
+        return int(float(sold_str.replace('k', '')) * 1000)
+    return int(sold_str)
+
+
+def _first(values: list) -> Optional[str]:
+    return values[0] if values else None
+
+
 def _require_scrapfly():
     try:
         from scrapfly import ScrapflyClient, ScrapeConfig  # type: ignore
-        from parsel import Selector  # type: ignore
     except Exception as e:  # pragma: no cover
         raise ScraperError(
             "Scrapfly extras not installed. Run: pip install -e .[scrapfly]"
         ) from e
-    return ScrapflyClient, ScrapeConfig, Selector
+    return ScrapflyClient, ScrapeConfig
+
+
+# One client per (key, country) so the connection pool survives across calls
+_CLIENTS: Dict[Tuple[str, str], Any] = {}
+
+
+@lru_cache(maxsize=32)
+def _headers(cookie: Optional[str]) -> Dict[str, str]:
+    """Request headers for `cookie`. The dict is shared; ScrapeConfig copies it."""
+    headers = {"accept-language": "en-US,en;q=0.9"}
+    if cookie:
+        headers["cookie"] = cookie
+    return headers
+
+
+def _client(sf_cfg: ScrapflyConfig) -> Any:
+    k = (sf_cfg.key, sf_cfg.country)
+    c = _CLIENTS.get(k)
+    if c is None:
+        ScrapflyClient, _ = _require_scrapfly()
+        _CLIENTS[k] = c = ScrapflyClient(key=sf_cfg.key)
+    return c
+
+
+@atexit.register
+def _close_clients() -> None:
+    for c in _CLIENTS.values():
+        try:
+            c.close()
+        except Exception:  # pragma: no cover
+            pass
+    _CLIENTS.clear()
 
 
 async def search_products_sf(sf_cfg: ScrapflyConfig, query: str, limit: int = 20) -> List[Dict]:
@@ -46,28 +306,23 @@ async def search_products_sf(sf_cfg: ScrapflyConfig, query: str, limit: int = 20
 
     Returns minimal dicts with productId and product URL.
     """
-    ScrapflyClient, ScrapeConfig, Selector = _require_scrapfly()
-    client = ScrapflyClient(key=sf_cfg.key)
-    headers = {"accept-language": "en-US,en;q=0.9"}
-    if sf_cfg.cookie:
-        headers["cookie"] = sf_cfg.cookie
+    _, ScrapeConfig = _require_scrapfly()
+    client = _client(sf_cfg)
+    headers = _headers(sf_cfg.cookie)
+
+    search_text = query.replace(' ', '+')  # same for every page
 
     async def fetch_page(page: int):
         url = (
             "https://www.aliexpress.com/wholesale?trafficChannel=main"
-            f"&d=y&CatId=0&SearchText={query.replace(' ', '+')}&ltype=wholesale&SortType=default&page={page}"
+            f"&d=y&CatId=0&SearchText={search_text}&ltype=wholesale&SortType=default&page={page}"
         )
         res = await client.async_scrape(
             ScrapeConfig(url, asp=True, country=sf_cfg.country, headers=headers, render_js=False)
         )
-        sel = Selector(res.content)
-        scripts = sel.xpath('//script[contains(.,"_init_data_=")]')
-        if not scripts:
-            return []
-        m = _INIT_DATA_RE.search("\n".join(s.get() for s in scripts))
-        if not m:
+        data = _parse_init_data(res.content)
+        if data is None:
             return []
-        data = json.loads(m.group(1))
         fields = data.get("data", {}).get("root", {}).get("fields", {})
         items = fields.get("mods", {}).get("itemList", {}).get("content", [])
         out: List[Dict] = []
@@ -84,587 +339,313 @@ async def search_products_sf(sf_cfg: ScrapflyConfig, query: str, limit: int = 20
             )
         return out
 
-    first = await fetch_page(1)
-    results = first[:]
+    # Keyed by productId: the same item can surface on several pages, keep the first
+    results: Dict[str, Dict] = {}
+    for preview in await fetch_page(1):
+        results.setdefault(preview["productId"], preview)
     # scrape next pages until limit is reached, up to 3 pages politely
     page = 2
     while len(results) < limit and page <= 3:
-        others = await fetch_page(page)
-        results.extend(others)
-        page += 1
         await random_sleep(0.5, 1.0)
-    return results[:limit]
-
+        try:
+            others = await fetch_page(page)
+        except Exception as e:
+            get_logger().warning(f"Search page {page} failed: {e}")
+            others = []
+        for preview in others:
+            results.setdefault(preview["productId"], preview)
+        page += 1
+    return list(results.values())[:limit]
 
-async def scrape_product_and_store_sf(sf_cfg: ScrapflyConfig, url: str) -> Tuple[Optional[Product], Optional[Tuple[str, str]]]:
-    """Scrape product info with focus on price, reviews, and shipping details."""
-    ScrapflyClient, ScrapeConfig, Selector = _require_scrapfly()
-    client = ScrapflyClient(key=sf_cfg.key)
-    headers = {"accept-language": "en-US,en;q=0.9"}
-    if sf_cfg.cookie:
-        headers["cookie"] = sf_cfg.cookie
 
-    try:
-        res = await client.async_scrape(
-            ScrapeConfig(
-                url,
-                asp=True,
-                country=sf_cfg.country,
-                headers=headers,
-                render_js=True,
-                auto_scroll=True,
-                rendering_wait=10000,
-            )
-        )
-        
-        if res.status_code != 200:
-            return None, None
-        
-        sel = Selector(res.content)
-        
-        # === TITLE EXTRACTION - Better strategy ===
-        title = ""
-        
-        # Strategy 1: Look in standard title tags
-        title_selectors = [
-            "//h1[@data-pl]//text()",
-            "//h1//text()",
-            "//title//text()",
-            "//*[contains(@class, 'product-title')]//text()",
-            "//*[@data-role='product-title']//text()"
-        ]
-        
-        for selector in title_selectors:
-            candidates = sel.xpath(selector).getall()
-            for candidate in candidates:
-                candidate = candidate.strip()
-                if len(candidate) > 15 and not any(skip in candidate.lower() for skip in ['aliexpress', 'buy', 'cheap', 'global']):
-                    title = candidate
-                    break
-            if title:
+def _parse_product_page(root: etree._Element, url: str) -> Tuple[Product, Optional[Tuple[str, str]]]:
+    """Extract product details and (store_name, store_url) from a parsed product page."""
+    # Script text is used by several strategies below; collect it once
+    scripts = _XP_SCRIPT_TEXT(root)
+    
+    # === TITLE EXTRACTION - Better strategy ===
+    title = ""
+    
+    # Strategy 1: Look in standard title tags
+    for xp in _XP_TITLE:
+        candidates = xp(root)
+        for candidate in candidates:
+            candidate = candidate.strip()
+            if len(candidate) > 15 and not _TITLE_SKIP_RE.search(candidate):
+                title = candidate
                 break
-        
-        # Strategy 2: Look in JSON data
-        if not title:
-            scripts = sel.xpath('//script//text()').getall()
-            for script in scripts:
-                title_patterns = [
-                    r'"title":\s*"([^"]+)"',
-                    r'"productTitle":\s*"([^"]+)"',
-                    r'"displayTitle":\s*"([^"]+)"'
-                ]
-                for pattern in title_patterns:
-                    matches = re.findall(pattern, script)
-                    for match in matches:
-                        if len(match) > 15:
-                            title = match
-                            break
-                    if title:
-                        break
-                if title:
-                    break
-        
-        # === PRICE EXTRACTION - Multiple strategies ===
-        price_text = None
-        currency = "USD"  # Default
-        
-        # Strategy 1: Look for price in JSON data within scripts
-        import re
-        scripts = sel.xpath('//script//text()').getall()
+        if title:
+            break
+    
+    # Strategy 2: Look in JSON data
+    if not title:
         for script in scripts:
-            # Look for price patterns in JSON
-            price_patterns = [
-                r'"formattedPrice":\s*"([^"]+)"',
-                r'"salePrice":\s*{\s*[^}]*"formattedPrice":\s*"([^"]+)"',
-                r'"minPrice":\s*([0-9]+\.?[0-9]*)',
-                r'"price":\s*"([^"]+)"',
-                r'"currentPrice":\s*"([^"]+)"'
-            ]
-            
-            for pattern in price_patterns:
-                matches = re.findall(pattern, script)
-                for match in matches:
-                    if match and ('$' in match or any(c.isdigit() for c in match)):
-                        # Clean the price
-                        if '$' in match:
-                            price_text = match
-                            if 'AU' in match or 'AUD' in match:
-                                currency = "AUD"
-                            break
-                        elif match.replace('.', '').isdigit():
-                            # Just a number, need to determine currency from context
-                            if 'AUD' in script or 'AU' in script:
-                                price_text = f"AU ${match}"
-                                currency = "AUD"
-                            else:
-                                price_text = f"${match}"
-                            break
-                if price_text:
+            for match in _by_priority(_TITLE_JSON_PATTERNS, script):
+                if len(match) > 15:
+                    title = match
                     break
-            if price_text:
+            if title:
                 break
-        
-        # Strategy 2: Look in HTML elements with price classes
-        if not price_text:
-            price_selectors = [
-                "//span[contains(@class,'price-current')]//text()",
-                "//span[contains(@class,'price-now')]//text()",
-                "//div[contains(@class,'price')]//span//text()",
-                "//*[contains(@class,'price') and contains(@class,'sale')]//text()",
-                "//*[contains(@class,'current-price')]//text()",
-                "//*[@data-spm-anchor-id]//span[contains(text(),'$')]//text()",
-            ]
-            
-            for selector in price_selectors:
-                candidates = sel.xpath(selector).getall()
-                for candidate in candidates:
-                    candidate = candidate.strip()
-                    if '$' in candidate and any(c.isdigit() for c in candidate):
-                        # Extract just the price part
-                        price_match = re.search(r'(AU\s*)?[\$]\s*(\d+[\.,]?\d*)', candidate)
-                        if price_match:
-                            price_text = price_match.group(0)
-                            if price_match.group(1):  # AU prefix found
-                                currency = "AUD"
-                            break
-                if price_text:
+    
+    # === PRICE EXTRACTION - Multiple strategies ===
+    price_text = None
+    currency = "USD"  # Default
+    
+    # Strategy 1: Look for price in JSON data within scripts
+    for script in scripts:
+        # Look for price patterns in JSON
+        for match in _by_priority(_PRICE_JSON_PATTERNS, script):
+            if match and ('$' in match or _HAS_DIGIT(match)):
+                # Clean the price
+                if '$' in match:
+                    price_text = match
+                    if 'AU' in match or 'AUD' in match:
+                        currency = "AUD"
                     break
-        
-        # Strategy 3: Look in meta tags
-        if not price_text:
-            meta_price = sel.xpath("//meta[@property='product:price:amount']/@content").get()
-            meta_currency = sel.xpath("//meta[@property='product:price:currency']/@content").get()
-            if meta_price:
-                price_text = f"${meta_price}"
-                if meta_currency:
-                    currency = meta_currency
-        
-        # Strategy 4: Search all text for price patterns
-        if not price_text:
-            all_text = sel.xpath("//text()").getall()
-            for text in all_text:
-                text = text.strip()
-                if len(text) < 20:  # Only look at short text snippets to avoid false positives
-                    price_patterns = [
-                        r'AU\s*\$\s*(\d+\.?\d*)',
-                        r'USD\s*\$?\s*(\d+\.?\d*)',
-                        r'\$\s*(\d+\.?\d*)',
-                        r'(\d+\.?\d*)\s*AUD',
-                        r'(\d+\.?\d*)\s*USD'
-                    ]
-                    
-                    for pattern in price_patterns:
-                        match = re.search(pattern, text, re.IGNORECASE)
-                        if match:
-                            if 'AU' in text.upper():
-                                price_text = f"AU ${match.group(1) if match.group(1) else match.group(0)}"
-                                currency = "AUD"
-                            else:
-                                price_text = f"${match.group(1) if match.group(1) else match.group(0)}"
-                                currency = "USD"
-                            break
-                if price_text:
+                elif match.replace('.', '').isdigit():
+                    # Just a number, need to determine currency from context
+                    if 'AUD' in script or 'AU' in script:
+                        price_text = f"AU ${match}"
+                        currency = "AUD"
+                    else:
+                        price_text = f"${match}"
                     break
-        
-        # === RATING ===
-        rating = None
-        import re
-        rating_patterns = [
-            r'(\d\.\d)\s*(?:star|rating)',
-            r'rating["\s:]*(\d\.\d)',
-            r'(\d\.\d)\s*out\s*of\s*5'
-        ]
-        page_text = sel.xpath('//text()').getall()
-        for text in page_text:
-            for pattern in rating_patterns:
-                match = re.search(pattern, text.lower())
-                if match:
-                    try:
-                        rating = float(match.group(1))
+        if price_text:
+            break
+    
+    # Strategy 2: Look in HTML elements with price classes
+    if not price_text:
+        for xp in _XP_PRICE:
+            candidates = xp(root)
+            for candidate in candidates:
+                candidate = candidate.strip()
+                if '$' in candidate and _HAS_DIGIT(candidate):
+                    # Extract just the price part
+                    price_match = _AU_PRICE_RE.search(candidate)
+                    if price_match:
+                        price_text = price_match.group(0)
+                        if price_match.group(1):  # AU prefix found
+                            currency = "AUD"
                         break
-                    except ValueError:
-                        continue
-            if rating:
+            if price_text:
                 break
-        
-        # === REVIEWS COUNT ===
-        num_reviews = None
-        import re
-        review_patterns = [
-            r'(\d+(?:,\d+)*)\s*(?:review|rating)',
-            r'(\d+(?:,\d+)*)\s*people\s*rated',
-            r'based\s*on\s*(\d+(?:,\d+)*)'
-        ]
+    
+    # Strategy 3: Look in meta tags
+    if not price_text:
+        meta_price = _first(_XP_META_PRICE(root))
+        meta_currency = _first(_XP_META_CURRENCY(root))
+        if meta_price:
+            price_text = f"${meta_price}"
+            if meta_currency:
+                currency = meta_currency
+    
+    # Every text node; shared by price strategy 4 and the metrics below
+    page_text = _XP_ALL_TEXT(root)
+
+    # Strategy 4: Search all text for price patterns
+    if not price_text:
         for text in page_text:
-            for pattern in review_patterns:
-                match = re.search(pattern, text.lower())
-                if match:
-                    try:
-                        num_reviews = int(match.group(1).replace(',', ''))
-                        break
-                    except ValueError:
-                        continue
-            if num_reviews:
+            text = text.strip()
+            if len(text) < 20:  # Only look at short text snippets to avoid false positives
+                text_up = text.upper()
+                # Every price pattern needs a '$' or a USD/AUD marker
+                if '$' not in text and 'USD' not in text_up and 'AUD' not in text_up:
+                    continue
+                for match in islice(_by_priority(_PRICE_TEXT_PATTERNS, text, first_only=True), 1):
+                    if 'AU' in text_up:
+                        price_text = f"AU ${match}"
+                        currency = "AUD"
+                    else:
+                        price_text = f"${match}"
+                        currency = "USD"
+            if price_text:
                 break
-        
-        # === ORDERS/SOLD COUNT ===
-        num_orders = None
-        import re
-        order_patterns = [
-            r'(\d+(?:,\d+)*(?:\.\d+)?[k]?)\s*(?:sold|order|piece)',
-            r'(\d+(?:,\d+)*)\s*people\s*bought',
-            r'(\d+(?:,\d+)*)\+?\s*sold'
-        ]
-        for text in page_text:
-            for pattern in order_patterns:
-                match = re.search(pattern, text.lower())
-                if match:
-                    try:
-                        sold_str = match.group(1).replace(',', '')
-                        if 'k' in sold_str.lower():
-                            num_orders = int(float(sold_str.lower().replace('k', '')) * 1000)
-                        else:
-                            num_orders = int(sold_str)
-                        break
-                    except ValueError:
-                        continue
-            if num_orders:
+    
+    # Rating/reviews/orders: scan all page text at once. Nodes are joined with
+    # NUL, which none of the patterns can match across.
+    doc_low = "\x00".join(page_text).lower()
+
+    # === RATING ===
+    rating = _scan_nodes(_RATING_PATTERNS, _RATING_ANY, doc_low, float)
+    
+    # === REVIEWS COUNT ===
+    num_reviews = _scan_nodes(
+        _REVIEW_PATTERNS, _REVIEW_ANY, doc_low, lambda v: int(v.replace(',', ''))
+    )
+    
+    # === ORDERS/SOLD COUNT ===
+    num_orders = _scan_nodes(_ORDER_PATTERNS, _ORDER_ANY, doc_low, _sold_count)
+    
+    # === SHIPPING INFO ===
+    shipping_info = {}  # ordered set of distinct entries
+    for text in _XP_SHIPPING_TEXT(root):
+        text = text.strip().lower()
+        if ('free' in text and 'shipping' in text) or ('day' in text and _HAS_DIGIT(text)):
+            shipping_info[text[:100]] = None  # Limit length
+            if len(shipping_info) == 3:  # Max 3 shipping options
                 break
-        
-        # === SHIPPING INFO ===
-        shipping_info = []
-        shipping_text = sel.xpath("//*[contains(text(), 'shipping') or contains(text(), 'delivery') or contains(text(), 'days')]//text()").getall()
-        for text in shipping_text:
-            text = text.strip().lower()
-            if ('free' in text and 'shipping' in text) or ('day' in text and any(c.isdigit() for c in text)):
-                shipping_info.append(text[:100])  # Limit length
-        
-        # === IMAGES - Get main product images only ===
-        main_images = []
-        img_selectors = [
-            "//div[contains(@class, 'image-view')]//img/@src",
-            "//div[contains(@class, 'product-image')]//img/@src", 
-            "//img[contains(@alt, 'product')]/@src"
-        ]
-        for selector in img_selectors:
-            imgs = sel.xpath(selector).getall()
-            for img in imgs[:5]:  # Max 5 images
-                if img.startswith('http') and 'aliexpress' in img:
-                    main_images.append(img)
-            if main_images:
+    
+    # === IMAGES - Get main product images only ===
+    main_images = []
+    for xp in _XP_IMAGES:
+        imgs = xp(root)
+        for img in imgs[:5]:  # Max 5 images
+            if img.startswith('http') and 'aliexpress' in img:
+                main_images.append(img)
+        if main_images:
+            break
+    
+    # === PRODUCT ID ===
+    pid = url.rpartition("item/")[2].partition(".")[0]
+    
+    # === CREATE PRODUCT OBJECT ===
+    product = Product(
+        product_title=title,
+        product_url=url,
+        product_id=pid,
+        price=price_text,
+        currency=currency,
+        rating=rating,
+        num_ratings=num_reviews,
+        num_orders=num_orders,
+        image_urls=main_images[:10],  # Limit to 10 images max
+        shipping_options=[{"info": info} for info in shipping_info]
+    )
+    
+    # === STORE EXTRACTION - Focus on AliExpress stores only ===
+    store_url = None
+    store_name = "Unknown Store"
+    
+    # Look for actual AliExpress store links only
+    # One walk over the store links; the old "broader search" fallback applied
+    # the same 'aliexpress' filter, so it could never find anything new
+    store_links = [link for link in _XP_STORE_LINKS(root) if 'aliexpress' in link]
+    
+    if store_links:
+        store_url = store_links[0]
+        if not store_url.startswith("http"):
+            store_url = "https://www.aliexpress.com" + store_url
+    
+    # If no store link found, try to construct from product page patterns
+    if not store_url:
+        # Try to find seller ID in scripts or data attributes
+        for script in scripts:
+            if 'store' not in script and 'seller' not in script:
+                continue
+            for seller_id in _by_priority(_STORE_ID_PATTERNS, script, first_only=True):
+                if len(seller_id) >= 8:  # Valid seller ID length
+                    store_url = f"https://www.aliexpress.com/store/{seller_id}"
+                    break
+            if store_url:
                 break
+    
+    # Extract store name - avoid common non-store text
+    if store_url:
+        # Strategy 1: Look near store links
+        store_name_candidates = _XP_STORE_LINK_TEXT(root)
         
-        # === PRODUCT ID ===
-        pid = url.split("item/")[-1].split(".")[0]
-        
-        # === CREATE PRODUCT OBJECT ===
-        product = Product(
-            product_title=title,
-            product_url=url,
-            product_id=pid,
-            price=price_text,
-            currency=currency,
-            rating=rating,
-            num_ratings=num_reviews,
-            num_orders=num_orders,
-            image_urls=main_images[:10],  # Limit to 10 images max
-            shipping_options=[{"info": info} for info in shipping_info[:3]]  # Max 3 shipping options
-        )
-        
-        # === STORE EXTRACTION - Focus on AliExpress stores only ===
-        store_url = None
-        store_name = "Unknown Store"
-        
-        # Look for actual AliExpress store links only
-        store_links = sel.xpath("//a[contains(@href, '/store/') and contains(@href, 'aliexpress')]/@href").getall()
-        if not store_links:
-            # Broader search but filter for aliexpress
-            all_store_links = sel.xpath("//a[contains(@href, '/store/')]/@href").getall()
-            store_links = [link for link in all_store_links if 'aliexpress' in link]
-        
-        if store_links:
-            store_url = store_links[0]
-            if not store_url.startswith("http"):
-                store_url = "https://www.aliexpress.com" + store_url
-        
-        # If no store link found, try to construct from product page patterns
-        if not store_url:
-            # Try to find seller ID in scripts or data attributes
-            scripts = sel.xpath('//script//text()').getall()
+        # Strategy 2: Look in JSON data for store name
+        if not any(len(c.strip()) > 3 for c in store_name_candidates):
             for script in scripts:
-                store_patterns = [
-                    r'"sellerId":\s*"?(\d+)"?',
-                    r'"storeNum":\s*"?(\d+)"?',
-                    r'store/(\d+)',
-                    r'seller.*?(\d{10,})'  # Look for long seller IDs
-                ]
-                for pattern in store_patterns:
-                    match = re.search(pattern, script)
-                    if match:
-                        seller_id = match.group(1)
-                        if len(seller_id) >= 8:  # Valid seller ID length
-                            store_url = f"https://www.aliexpress.com/store/{seller_id}"
-                            break
-                if store_url:
-                    break
-        
-        # Extract store name - avoid common non-store text
-        if store_url:
-            # Strategy 1: Look near store links
-            store_name_candidates = sel.xpath("//a[contains(@href, '/store/')]//text()").getall()
-            
-            # Strategy 2: Look in JSON data for store name
-            if not any(len(c.strip()) > 3 for c in store_name_candidates):
-                for script in scripts:
-                    name_patterns = [
-                        r'"storeName":\s*"([^"]+)"',
-                        r'"sellerName":\s*"([^"]+)"',
-                        r'"companyName":\s*"([^"]+)"'
-                    ]
-                    for pattern in name_patterns:
-                        match = re.search(pattern, script)
-                        if match and len(match.group(1)) > 3:
-                            store_name_candidates.append(match.group(1))
-            
-            # Strategy 3: Look for seller display elements
-            seller_elements = sel.xpath("//*[contains(@class, 'seller') or contains(@class, 'store')]//text()").getall()
-            store_name_candidates.extend(seller_elements)
-            
-            # Filter and select best store name
-            for candidate in store_name_candidates:
-                candidate = candidate.strip()
-                if (len(candidate) > 3 and len(candidate) < 80 and 
-                    not candidate.isdigit() and 
-                    not any(word in candidate.lower() for word in [
-                        'visit', 'store', 'shop', 'view', 'see', 'more', 'google', 'play', 
-                        'app', 'download', 'install', 'mobile', 'click', 'link', 'url'
-                    ])):
-                    store_name = candidate
-                    break
-            
-            # If still no good name, use a generic name based on the seller ID
-            if store_name == "Unknown Store" and store_url:
-                seller_id = re.search(r'/store/(\d+)', store_url)
-                if seller_id:
-                    store_name = f"Store {seller_id.group(1)}"
-        
-        return product, (store_name, store_url) if store_url else None
+                for match in _by_priority(_STORE_NAME_PATTERNS, script, first_only=True):
+                    if len(match) > 3:
+                        store_name_candidates.append(match)
+        
+        # Strategy 3: Look for seller display elements
+        seller_elements = _XP_SELLER_TEXT(root)
+        store_name_candidates.extend(seller_elements)
+        
+        # Filter and select best store name
+        for candidate in store_name_candidates:
+            candidate = candidate.strip()
+            if (len(candidate) > 3 and len(candidate) < 80 and 
+                not candidate.isdigit() and 
+                not _STORE_SKIP_RE.search(candidate)):
+                store_name = candidate
+                break
         
-    except Exception as e:
-        logger = get_logger()
-        logger.warning(f"Error scraping {url}: {e}")
-        return None, None
-    """Scrape both product info and store info from a product page.
+        # If still no good name, use a generic name based on the seller ID
+        if store_name == "Unknown Store" and store_url:
+            seller_id = _STORE_URL_ID_RE.search(store_url)
+            if seller_id:
+                store_name = f"Store {seller_id.group(1)}"
     
-    Returns (Product, (store_name, store_url)) or (None, None) if failed.
+    return product, (store_name, store_url) if store_url else None
+
+
+# Plain fetch first; JS rendering is only paid for when that page is incomplete
+_PRODUCT_FETCHES = (
+    {"render_js": False},
+    {"render_js": True, "rendering_wait": 5000},
+)
+# Assignments of the embedded product JSON that the parser reads from scripts
+_PRODUCT_JSON_RE = re.compile(r"window\.runParams\s*=|_init_data_\s*=")
+
+
+def _plain_page_usable(html: str, product: Product) -> bool:
+    """Whether a page fetched without JS rendering is as complete as a rendered one.
+
+    Title and price alone are not enough: without the embedded product JSON
+    the rating, review and order counts are usually missing.
     """
-    ScrapflyClient, ScrapeConfig, Selector = _require_scrapfly()
-    client = ScrapflyClient(key=sf_cfg.key)
-    headers = {"accept-language": "en-US,en;q=0.9"}
-    if sf_cfg.cookie:
-        headers["cookie"] = sf_cfg.cookie
+    if not product.product_title or product.price is None:
+        return False
+    if _PRODUCT_JSON_RE.search(html):
+        return True
+    return None not in (product.rating, product.num_ratings, product.num_orders)
+
+
+async def scrape_product_and_store_sf(sf_cfg: ScrapflyConfig, url: str) -> Tuple[Optional[Product], Optional[Tuple[str, str]]]:
+    """Scrape product info with focus on price, reviews, and shipping details."""
+    _, ScrapeConfig = _require_scrapfly()
+    client = _client(sf_cfg)
+    headers = _headers(sf_cfg.cookie)
 
     try:
-        res = await client.async_scrape(
-            ScrapeConfig(
-                url,
-                asp=True,
-                country=sf_cfg.country,
-                headers=headers,
-                render_js=True,
-                auto_scroll=True,
-                rendering_wait=8000,
+        product, store = None, None
+        for opts in _PRODUCT_FETCHES:
+            res = await client.async_scrape(
+                ScrapeConfig(url, asp=True, country=sf_cfg.country, headers=headers, **opts)
             )
-        )
-        
-        if res.status_code != 200:
-            return None, None
-        
-        sel = Selector(res.content)
-        
-        # Extract product information with better selectors
-        title = sel.xpath(
-            "//h1[@data-pl]/text()|"
-            "//h1//span/text()|"
-            "//h1/text()|"
-            "//*[@class='product-title-text']/text()|"
-            "//*[contains(@class, 'title')]/text()"
-        ).get()
-        
-        # Better price extraction
-        price_text = sel.xpath(
-            "//span[contains(@class,'currentPrice')]/text()|"
-            "//span[contains(@class,'notranslate')]/text()|"
-            "//meta[@itemprop='price']/@content|"
-            "//*[contains(@class,'price-current')]/text()|"
-            "//*[contains(text(),'$') or contains(text(),'AU')]/text()"
-        ).get()
-        
-        # Better currency extraction
-        currency = sel.xpath(
-            "//meta[@itemprop='priceCurrency']/@content|"
-            "//span[contains(@class,'currency')]/text()|"
-            "//script[contains(., 'currencyCode')]"
-        ).get() or "AUD"
-        
-        if currency and '"currencyCode"' in currency:
-            import re
-            match = re.search(r'"currencyCode":"([^"]+)"', currency)
-            currency = match.group(1) if match else "AUD"
-        
-        pid = url.split("item/")[-1].split(".")[0]
-        
-        # Better image extraction
-        imgs = sel.xpath(
-            "//img[contains(@class,'magnifier')]/@src|"
-            "//img[contains(@class,'product')]/@src|"
-            "//img/@data-src|"
-            "//img/@src"
-        ).getall()
-        
-        # Better rating extraction
-        rating_text = sel.xpath(
-            "//div[contains(@class,'rating-star')]/text()|"
-            "//span[contains(@class,'rating')]/text()|"
-            "//div[contains(@class,'rating--wrap')]/div/text()|"
-            "//span[contains(@class,'overview-rating-average')]/text()|"
-            "//*[contains(text(),'stars') or contains(text(),'rating')]/text()"
-        ).get()
-        
-        # Better reviews count extraction
-        num_ratings_text = sel.xpath(
-            "//a[contains(@class,'reviewer--reviews')]/text()|"
-            "//span[@id='j-cnt-review']/text()|"
-            "//*[contains(text(),'review') and contains(text(),'+')]/text()|"
-            "//*[contains(@class,'review')]/text()"
-        ).get()
-        
-        # Extract additional product info
-        original_price = sel.xpath(
-            "//span[contains(@class,'original-price') or contains(@class,'old-price')]/text()|"
-            "//del/text()"
-        ).get()
-        
-        # Extract orders/sold information  
-        orders_text = sel.xpath(
-            "//*[contains(text(),'sold') or contains(text(),'orders')]/text()|"
-            "//*[contains(@class,'trade')]/text()"
-        ).get()
-        
-        # Extract shipping info
-        shipping_text = sel.xpath(
-            "//*[contains(@class,'shipping') or contains(text(),'free shipping')]/text()|"
-            "//*[contains(text(),'delivery')]/text()"
-        ).getall()
-        
-        def to_float(s: Optional[str]) -> Optional[float]:
-            if not s:
-                return None
-            # Clean the string more thoroughly
-            s = s.replace(",", ".").replace("$", "").replace("AU", "").replace("USD", "").strip()
-            # Extract just numbers and decimal point
-            import re
-            match = re.search(r'(\d+\.?\d*)', s)
-            if match:
-                try:
-                    return float(match.group(1))
-                except Exception:
-                    return None
-            return None
-
-        def to_int(s: Optional[str]) -> Optional[int]:
-            if not s:
-                return None
-            # Extract digits from strings like "1,234+ sold" or "2.5K reviews"
-            import re
-            # Handle K, M suffixes
-            if 'K' in s.upper():
-                match = re.search(r'(\d+\.?\d*)\s*K', s.upper())
-                if match:
-                    return int(float(match.group(1)) * 1000)
-            elif 'M' in s.upper():
-                match = re.search(r'(\d+\.?\d*)\s*M', s.upper())
-                if match:
-                    return int(float(match.group(1)) * 1000000)
-            
-            # Regular number extraction
-            digits = re.sub(r'[^\d]', '', s)
-            return int(digits) if digits else None
-
-        product = Product(
-            product_title=(title or "").strip(),
-            product_url=url,
-            product_id=pid,
-            price=price_text.strip() if price_text else None,
-            currency=currency.strip() if currency else "AUD",
-            original_price=original_price.strip() if original_price else None,
-            rating=to_float(rating_text),
-            num_ratings=to_int(num_ratings_text),
-            num_orders=to_int(orders_text) if orders_text else None,
-            image_urls=[i for i in imgs if i and i.startswith("http")][:20],
-        )
-        
-        # Extract store information with better selectors
-        store_links = sel.xpath("//a[contains(@href, '/store/')]/@href").getall()
-        store_url = None
-        store_name = "Unknown Seller"
+            if res.status_code != 200:
+                continue
+            product, store = _parse_product_page(_html_root(res.content), url)
+            if _plain_page_usable(res.content, product):
+                break
+        return product, store
         
-        if store_links:
-            store_url = store_links[0]
-            # Fix the URL formatting issue
-            if store_url.startswith("//"):
-                store_url = "https:" + store_url
-            elif store_url.startswith("/"):
-                store_url = "https://www.aliexpress.com" + store_url
-            elif not store_url.startswith("http"):
-                store_url = "https://www.aliexpress.com/" + store_url
-            
-            # Better store name extraction
-            store_name_candidates = sel.xpath(
-                "//a[contains(@href, '/store/')]/text()|"
-                "//a[contains(@href, '/store/')]//span/text()|"
-                "//*[contains(@class,'shop-name')]/text()|"
-                "//*[contains(@class,'store-name')]/text()|"
-                "//*[contains(@class,'seller-name')]/text()|"
-                "//*[@data-role='store-name']/text()|"
-                "//div[contains(@class,'seller')]//text()[normalize-space()]"
-            ).getall()
-            
-            # Filter and pick the best store name
-            for candidate in store_name_candidates:
-                candidate = candidate.strip()
-                # Skip common non-name texts
-                skip_words = ["sold by", "store", "shop", "seller", "visit", "follow", "contact"]
-                if (candidate and 
-                    len(candidate) > 2 and 
-                    len(candidate) < 100 and 
-                    not any(skip.lower() in candidate.lower() for skip in skip_words) and
-                    not candidate.isdigit()):
-                    store_name = candidate
-                    break
-            
-            # If we still have a generic name, try to extract from URL
-            if store_name in ["Unknown Seller", "Sold by"]:
-                import re
-                # Extract store ID from URL and use it
-                store_id_match = re.search(r'/store/(\d+)', store_url)
-                if store_id_match:
-                    store_name = f"Store {store_id_match.group(1)}"
-
-        return product, (store_name, store_url) if store_url else None
-    
-    except Exception:
+    except Exception as e:
+        logger = get_logger()
+        logger.warning(f"Error scraping {url}: {e}")
         return None, None
 
 
+async def scrape_many_sf(
+    sf_cfg: ScrapflyConfig, urls: List[str], concurrency: int = 3
+) -> List[Tuple[Optional[Product], Optional[Tuple[str, str]]] | BaseException]:
+    """Scrape product pages concurrently with at most `concurrency` requests in flight.
+
+    Results keep the order of `urls`; a failed scrape is returned as its exception.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one(url: str) -> Tuple[Optional[Product], Optional[Tuple[str, str]]]:
+        async with sem:
+            try:
+                return await scrape_product_and_store_sf(sf_cfg, url)
+            finally:
+                # Be polite
+                await random_sleep(0.5, 1.2)
+
+    return await asyncio.gather(*(_one(u) for u in urls), return_exceptions=True)
+
+
 async def scrape_seller_sf(sf_cfg: ScrapflyConfig, seller_name: str, seller_url: str) -> Seller:
     """Scrape seller info focusing on key metrics only."""
     try:
-        ScrapflyClient, ScrapeConfig, Selector = _require_scrapfly()
-        client = ScrapflyClient(key=sf_cfg.key)
-        headers = {"accept-language": "en-US,en;q=0.9"}
-        if sf_cfg.cookie:
-            headers["cookie"] = sf_cfg.cookie
+        _, ScrapeConfig = _require_scrapfly()
+        client = _client(sf_cfg)
+        headers = _headers(sf_cfg.cookie)
         
         res = await client.async_scrape(
             ScrapeConfig(seller_url, asp=True, country=sf_cfg.country, headers=headers, render_js=False)
@@ -673,7 +654,7 @@ async def scrape_seller_sf(sf_cfg: ScrapflyConfig, seller_name: str, seller_url:
         if res.status_code != 200:
             raise Exception("Failed to load store page")
             
-        sel = Selector(res.content)
+        root = _html_root(res.content)
         
         # Simple, clean extraction
         rating = None
@@ -681,10 +662,9 @@ async def scrape_seller_sf(sf_cfg: ScrapflyConfig, seller_name: str, seller_url:
         location = None
         
         # Look for rating (format: 4.8, 95.5%, etc.)
-        rating_text = sel.xpath("//*[contains(text(), '.') and (contains(text(), '%') or contains(., '/5'))]//text()").getall()
+        rating_text = _XP_SELLER_RATING_TEXT(root)
         for text in rating_text[:5]:  # Check first 5 only
-            import re
-            match = re.search(r'(\d+\.?\d*)(?:%|/5)', text)
+            match = _SELLER_RATING_RE.search(text)
             if match:
                 try:
                     rating_val = float(match.group(1))
@@ -697,10 +677,9 @@ async def scrape_seller_sf(sf_cfg: ScrapflyConfig, seller_name: str, seller_url:
                     continue
         
         # Look for followers (format: 1,234 followers)
-        followers_text = sel.xpath("//*[contains(text(), 'follow')]//text()").getall()
+        followers_text = _XP_FOLLOWERS_TEXT(root)
         for text in followers_text[:3]:
-            import re
-            match = re.search(r'(\d+(?:,\d+)*)', text)
+            match = _FOLLOWERS_RE.search(text)
             if match:
                 try:
                     followers = int(match.group(1).replace(',', ''))
@@ -709,11 +688,11 @@ async def scrape_seller_sf(sf_cfg: ScrapflyConfig, seller_name: str, seller_url:
                     continue
         
         # Look for location
-        location_candidates = sel.xpath("//text()").getall()
-        for text in location_candidates:
-            text = text.strip()
+        # (lazy walk; the store header sits near the top of the DOM)
+        for text in islice(root.itertext(), LOCATION_SCAN_NODES):
             # Look for country/city patterns
-            if any(country in text for country in ['China', 'USA', 'UK', 'Germany', 'Japan']):
+            if _COUNTRY_RE.search(text):
+                text = text.strip()
                 if len(text) < 50:  # Reasonable location length
                     location = text
                     break
@@ -730,106 +709,26 @@ async def scrape_seller_sf(sf_cfg: ScrapflyConfig, seller_name: str, seller_url:
         num_followers=followers,
         store_location=location,
     )
-    """Enhanced seller info extraction via page HTML."""
-    ScrapflyClient, ScrapeConfig, Selector = _require_scrapfly()
-    client = ScrapflyClient(key=sf_cfg.key)
-    headers = {"accept-language": "en-US,en;q=0.9"}
-    if sf_cfg.cookie:
-        headers["cookie"] = sf_cfg.cookie
-    
-    try:
-        res = await client.async_scrape(
-            ScrapeConfig(seller_url, asp=True, country=sf_cfg.country, headers=headers, render_js=True, rendering_wait=5000)
-        )
-        sel = Selector(res.content)
-        
-        # Better rating extraction
-        rating = sel.xpath(
-            "//div[contains(@class,'store-rating')]/text()|"
-            "//span[contains(@class,'score')]/text()|"
-            "//div[contains(@class,'rating')]//text()[contains(.,'.')][1]|"
-            "//*[contains(@class,'seller-score')]/text()"
-        ).get()
-        
-        # Better followers extraction
-        followers = sel.xpath(
-            "//span[contains(@class,'follow')]/text()|"
-            "//*[contains(text(),'followers') or contains(text(),'follow')]/text()|"
-            "//*[contains(@class,'fans')]/text()"
-        ).get()
-        
-        # Better location extraction  
-        location = sel.xpath(
-            "//span[contains(@class,'store-loc')]/text()|"
-            "//*[@data-role='store-location']/text()|"
-            "//*[contains(@class,'location')]/text()|"
-            "//*[contains(text(),'China') or contains(text(),'Hong Kong') or contains(text(),'Taiwan')]/text()[1]"
-        ).get()
-        
-        # Extract business time
-        years_text = sel.xpath(
-            "//*[contains(text(),'year') or contains(text(),'since')]/text()"
-        ).get()
-        
-        # Extract store ratings count - filter out very long strings
-        reviews_text = sel.xpath(
-            "//*[contains(text(),'review') or contains(text(),'feedback')]/text()"
-        ).get()
-        
-        # Filter out encoded/garbage data
-        if reviews_text and len(reviews_text) > 100:
-            reviews_text = None
-        
-    except Exception:
-        rating = None
-        followers = None
-        location = None
-        years_text = None
-        reviews_text = None
-    
-    def to_float(s: Optional[str]) -> Optional[float]:
-        if not s:
-            return None
-        # Clean and extract number
-        import re
-        s = s.replace(",", ".").strip()
-        match = re.search(r'(\d+\.?\d*)', s)
-        if match:
+
+
+async def scrape_sellers_sf(
+    sf_cfg: ScrapflyConfig, stores: List[Tuple[str, str]], concurrency: int = 3
+) -> List[Seller | BaseException]:
+    """Scrape (store_name, store_url) pairs concurrently, like scrape_many_sf."""
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one(store_name: str, store_url: str) -> Seller:
+        async with sem:
             try:
-                return float(match.group(1))
-            except Exception:
-                return None
-        return None
-    
-    def to_int(s: Optional[str]) -> Optional[int]:
-        if not s:
-            return None
-        import re
-        # Handle K, M suffixes for followers
-        if 'K' in s.upper():
-            match = re.search(r'(\d+\.?\d*)\s*K', s.upper())
-            if match:
-                return int(float(match.group(1)) * 1000)
-        elif 'M' in s.upper():
-            match = re.search(r'(\d+\.?\d*)\s*M', s.upper())
-            if match:
-                return int(float(match.group(1)) * 1000000)
-        
-        digits = re.sub(r'[^\d]', '', s)
-        return int(digits) if digits else None
-    
-    return Seller(
-        seller_name=seller_name,
-        seller_url=seller_url,
-        seller_rating=to_float(rating),
-        num_followers=to_int(followers),
-        store_location=location.strip() if location else None,
-        years_on_platform=to_int(years_text),
-        total_reviews=to_int(reviews_text),
-    )
+                return await scrape_seller_sf(sf_cfg, store_name, store_url)
+            finally:
+                # Be polite
+                await random_sleep(0.3, 0.8)
 
+    return await asyncio.gather(*(_one(n, u) for n, u in stores), return_exceptions=True)
 
-async def run_with_scrapfly(query: str, *, max_suppliers: int, max_products_per_seller: int, limit: int, country: str, key: str, cookie: Optional[str] = None) -> ScrapeResult:
+
+async def run_with_scrapfly(query: str, *, max_suppliers: int, max_products_per_seller: int, limit: int, country: str, key: str, cookie: Optional[str] = None, concurrency: int = 3) -> ScrapeResult:
     """End-to-end scrape orchestrated via Scrapfly backend - FIXED VERSION."""
     logger = get_logger()
     sf_cfg = ScrapflyConfig(key=key, country=country, cookie=cookie)
@@ -844,58 +743,59 @@ async def run_with_scrapfly(query: str, *, max_suppliers: int, max_products_per_
         return ScrapeResult(query=query)
     
     # Scrape products and collect store information
-    sellers_map: Dict[str, Tuple[str, List[Product]]] = {}
+    # store_url -> first store name seen / products, in discovery order
+    store_names: Dict[str, str] = {}
+    products_by_store: DefaultDict[str, List[Product]] = defaultdict(list)
     processed_products = 0
     
-    for preview in previews:
-        if processed_products >= limit or len(sellers_map) >= max_suppliers:
+    urls = [preview["url"] for preview in previews]
+    logger.info(f"Scraping up to {len(urls)} products (concurrency={concurrency})")
+    
+    # Fetch in windows of `concurrency` and fold each window in search order,
+    # so the caps are checked between windows and no paid request is made once
+    # either is reached; a window never asks for more than the products still wanted
+    next_url = 0
+    while next_url < len(urls):
+        if processed_products >= limit or len(products_by_store) >= max_suppliers:
             break
+        size = max(1, min(concurrency, limit - processed_products))
+        window = urls[next_url:next_url + size]
+        next_url += len(window)
+        scraped = await scrape_many_sf(sf_cfg, window, concurrency=concurrency)
+        
+        for url, outcome in zip(window, scraped):
+            if processed_products >= limit or len(products_by_store) >= max_suppliers:
+                break
+                
+            if isinstance(outcome, Exception):
+                logger.warning(f"Error scraping product {url}: {outcome}")
+                continue
             
-        try:
-            logger.info(f"Scraping product: {preview['url']}")
-            product, store_info = await scrape_product_and_store_sf(sf_cfg, preview["url"])
-            
+            product, store_info = outcome
             if product and store_info:
                 store_name, store_url = store_info
-                if store_url not in sellers_map:
-                    sellers_map[store_url] = (store_name, [])
-                sellers_map[store_url][1].append(product)
+                store_names.setdefault(store_url, store_name)
+                products_by_store[store_url].append(product)
                 processed_products += 1
                 logger.info(f"Successfully scraped product from store: {store_name}")
             else:
-                logger.warning(f"Failed to extract product or store info from {preview['url']}")
-            
-            # Be polite
-            await random_sleep(0.5, 1.2)
-            
-        except Exception as e:
-            logger.warning(f"Error scraping product {preview['url']}: {e}")
-            continue
+                logger.warning(f"Failed to extract product or store info from {url}")
     
-    logger.info(f"Found {len(sellers_map)} unique sellers")
+    logger.info(f"Found {len(products_by_store)} unique sellers")
     
-    # Build result with sellers
+    # Build result with sellers (products_by_store is already capped at max_suppliers)
     result = ScrapeResult(query=query)
-    seller_count = 0
+    stores = [(name, url) for url, name in store_names.items()]
+    sellers = await scrape_sellers_sf(sf_cfg, stores, concurrency=concurrency)
     
-    for store_url, (store_name, products) in sellers_map.items():
-        if seller_count >= max_suppliers:
-            break
-            
-        try:
-            seller = await scrape_seller_sf(sf_cfg, store_name, store_url)
-            # Add products (limited by max_products_per_seller)
-            seller.products = products[:max_products_per_seller]
-            result.suppliers.append(seller)
-            seller_count += 1
-            logger.info(f"Added seller: {store_name} with {len(seller.products)} products")
-            
-            # Be polite
-            await random_sleep(0.3, 0.8)
-            
-        except Exception as e:
-            logger.warning(f"Error scraping seller info for {store_name}: {e}")
+    for (store_name, store_url), seller in zip(stores, sellers):
+        if isinstance(seller, Exception):
+            logger.warning(f"Error scraping seller info for {store_name}: {seller}")
             continue
+        # Add products (limited by max_products_per_seller)
+        seller.products = products_by_store[store_url][:max_products_per_seller]
+        result.suppliers.append(seller)
+        logger.info(f"Added seller: {store_name} with {len(seller.products)} products")
     
     logger.info(f"Final result: {len(result.suppliers)} suppliers")
     return result
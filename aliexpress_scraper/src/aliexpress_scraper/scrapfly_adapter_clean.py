@@ -9,10 +9,17 @@ and simple seller info via the Scrapfly API. This is optional; install extras:
 
 and provide an API key via Config.scrapfly_key or SCRAPFLY_KEY env.
 """
+import asyncio
+import atexit
 import json
 import re
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, DefaultDict, Dict, List, Optional, Tuple
+
+from lxml import etree
+from lxml.etree import XPath
 
 from .exceptions import ScraperError
 from .logger import get_logger
@@ -20,7 +27,49 @@ from .models import Product, ScrapeResult, Seller
 from .utils import random_sleep
 
 
-_INIT_DATA_RE = re.compile(r"_init_data_\s*=\s*{\s*data:\s*({.+}) }", re.S)
+# Anchored prefix of `_init_data_ = { data: {...} }`; the JSON itself is read
+# with raw_decode so no regex has to scan (or backtrack over) the payload
+_INIT_DATA_HEAD_RE = re.compile(r"_init_data_\s*=\s*{\s*data:\s*(?={)")
+_JSON_DECODER = json.JSONDecoder()
+_NON_NUMERIC_RE = re.compile(r"[^\d.]")
+_NON_DIGIT_RE = re.compile(r"\D")
+
+# Precompiled XPath; evaluated on the parsel Selector's lxml root and returning plain str
+_XP_TITLE = XPath("//h1[@data-pl]/text()|//h1/text()", smart_strings=False)
+_XP_PRICE = XPath(
+    "//span[contains(@class,'currentPrice')]/text()|//meta[@itemprop='price']/@content",
+    smart_strings=False,
+)
+_XP_CURRENCY = XPath("//meta[@itemprop='priceCurrency']/@content", smart_strings=False)
+_XP_IMAGES = XPath("//img/@src|//img/@data-src", smart_strings=False)
+_XP_RATING = XPath(
+    "//div[contains(@class,'rating--wrap')]/div/text()"
+    "|//span[contains(@class,'overview-rating-average')]/text()",
+    smart_strings=False,
+)
+_XP_NUM_RATINGS = XPath(
+    "//a[contains(@class,'reviewer--reviews')]/text()|//span[@id='j-cnt-review']/text()",
+    smart_strings=False,
+)
+_XP_STORE_LINKS = XPath("//a[contains(@href, '/store/')]/@href", smart_strings=False)
+_XP_STORE_NAME = XPath(
+    "//a[contains(@href, '/store/')]//text()|"
+    "//span[contains(@class, 'seller')]/text()|"
+    "//div[contains(@class, 'store')]//text()",
+    smart_strings=False,
+)
+# Store page fields, walked in one pass by _seller_fields
+_XP_SELLER_FIELDS = {
+    "rating": XPath(
+        "//div[contains(@class,'store-rating') or contains(@class,'score')]/text()",
+        smart_strings=False,
+    ),
+    "followers": XPath("//span[contains(@class,'follow')]/text()", smart_strings=False),
+    "location": XPath(
+        "//span[contains(@class,'store-loc')]/text()|//*[@data-role='store-location']/text()",
+        smart_strings=False,
+    ),
+}
 
 
 @dataclass
@@ -30,6 +79,84 @@ class ScrapflyConfig:
     cookie: Optional[str] = None  # e.g., aep_usuc_f=...
 
 
+def _parse_init_data(html: str) -> Optional[Dict]:
+    """Decode the JSON object assigned to `_init_data_.data` in a search page, if present."""
+    pos = html.find("_init_data_")
+    while pos != -1:
+        m = _INIT_DATA_HEAD_RE.match(html, pos)
+        if m:
+            return _JSON_DECODER.raw_decode(html, m.end())[0]
+        pos = html.find("_init_data_", pos + 1)
+    return None
+
+
+def _first(values: list) -> Optional[str]:
+    return values[0] if values else None
+
+
+def _seller_fields(root: etree._Element) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """(rating, followers, location) text from a store page in a single tree walk.
+
+    Picks what `_first(_XP_SELLER_FIELDS[field](root))` would: the first text node,
+    in document order, directly under a matching element.
+    """
+    found: Dict[str, Optional[str]] = dict.fromkeys(_XP_SELLER_FIELDS)
+    pending = len(found)
+    for el in root.iter(etree.Element):
+        cls = el.get("class")
+        role = el.get("data-role")
+        if cls is None and role is None:
+            continue
+        cls = cls or ""
+        matched = []
+        if el.tag == "div" and ("store-rating" in cls or "score" in cls):
+            matched.append("rating")
+        elif el.tag == "span":
+            if "follow" in cls:
+                matched.append("followers")
+            if "store-loc" in cls:
+                matched.append("location")
+        if role == "store-location" and "location" not in matched:
+            matched.append("location")
+        for field in matched:
+            if found[field] is not None:
+                continue
+            if el.text is not None:
+                found[field] = el.text
+            elif any(child.tail is not None for child in el):
+                # Own text only after child elements, so a matching descendant's text
+                # may come first in document order; let the XPath decide (rare)
+                found[field] = _first(_XP_SELLER_FIELDS[field](root))
+            else:
+                continue
+            pending -= 1
+        if not pending:
+            break
+    return found["rating"], found["followers"], found["location"]
+
+
+def _to_float(s: Optional[str]) -> Optional[float]:
+    if not s:
+        return None
+    s = s.replace(",", ".")
+    if s.replace(".", "", 1).isdecimal():  # plain "123" / "4.7": skip the regex
+        return float(s)
+    num = _NON_NUMERIC_RE.sub("", s)
+    try:
+        return float(num)
+    except Exception:
+        return None
+
+
+def _to_int(s: Optional[str]) -> Optional[int]:
+    if not s:
+        return None
+    if s.isdecimal():  # plain digits: skip the regex
+        return int(s)
+    digits = _NON_DIGIT_RE.sub("", s)
+    return int(digits) if digits else None
+
+
 def _require_scrapfly():
     try:
         from scrapfly import ScrapflyClient, ScrapeConfig  # type: ignore
@@ -41,33 +168,62 @@ def _require_scrapfly():
     return ScrapflyClient, ScrapeConfig, Selector
 
 
+# One client per (key, country) so the connection pool survives across calls
+_CLIENTS: Dict[Tuple[str, str], Any] = {}
+
+
+@lru_cache(maxsize=32)
+def _headers(cookie: Optional[str]) -> Dict[str, str]:
+    """Request headers for `cookie`. The dict is shared; ScrapeConfig copies it."""
+    headers = {"accept-language": "en-US,en;q=0.9"}
+    if cookie:
+        headers["cookie"] = cookie
+    return headers
+
+
+def _client(sf_cfg: ScrapflyConfig) -> Any:
+    k = (sf_cfg.key, sf_cfg.country)
+    c = _CLIENTS.get(k)
+    if c is None:
+        ScrapflyClient, _, _ = _require_scrapfly()
+        _CLIENTS[k] = c = ScrapflyClient(key=sf_cfg.key)
+    return c
+
+
+@atexit.register
+def _close_clients() -> None:
+    for c in _CLIENTS.values():
+        try:
+            c.close()
+        except Exception:  # pragma: no cover
+            pass
+    _CLIENTS.clear()
+
+
 async def search_products_sf(sf_cfg: ScrapflyConfig, query: str, limit: int = 20) -> List[Dict]:
     """Use Scrapfly to fetch search pages and return list of product preview dicts.
 
     Returns minimal dicts with productId and product URL.
     """
-    ScrapflyClient, ScrapeConfig, Selector = _require_scrapfly()
-    client = ScrapflyClient(key=sf_cfg.key)
-    headers = {"accept-language": "en-US,en;q=0.9"}
-    if sf_cfg.cookie:
-        headers["cookie"] = sf_cfg.cookie
+    _, ScrapeConfig, _ = _require_scrapfly()
+    client = _client(sf_cfg)
+    headers = _headers(sf_cfg.cookie)
+
+    search_text = query.replace(' ', '+')  # same for every page
 
     async def fetch_page(page: int):
         url = (
             "https://www.aliexpress.com/wholesale?trafficChannel=main"
-            f"&d=y&CatId=0&SearchText={query.replace(' ', '+')}&ltype=wholesale&SortType=default&page={page}"
+            f"&d=y&CatId=0&SearchText={search_text}&ltype=wholesale&SortType=default&page={page}"
         )
         res = await client.async_scrape(
             ScrapeConfig(url, asp=True, country=sf_cfg.country, headers=headers, render_js=False)
         )
-        sel = Selector(res.content)
-        scripts = sel.xpath('//script[contains(.,"_init_data_=")]')
-        if not scripts:
+        # Script bodies are raw text in HTML, so the payload can be decoded
+        # straight from the response without building a DOM
+        data = _parse_init_data(res.content)
+        if data is None:
             return []
-        m = _INIT_DATA_RE.search("\n".join(s.get() for s in scripts))
-        if not m:
-            return []
-        data = json.loads(m.group(1))
         fields = data.get("data", {}).get("root", {}).get("fields", {})
         items = fields.get("mods", {}).get("itemList", {}).get("content", [])
         out: List[Dict] = []
@@ -84,16 +240,90 @@ async def search_products_sf(sf_cfg: ScrapflyConfig, query: str, limit: int = 20
             )
         return out
 
-    first = await fetch_page(1)
-    results = first[:]
+    # Keyed by productId: the same item can surface on several pages, keep the first
+    results: Dict[str, Dict] = {}
+    for preview in await fetch_page(1):
+        results.setdefault(preview["productId"], preview)
     # scrape next pages until limit is reached, up to 3 pages politely
     page = 2
     while len(results) < limit and page <= 3:
-        others = await fetch_page(page)
-        results.extend(others)
-        page += 1
         await random_sleep(0.5, 1.0)
-    return results[:limit]
+        try:
+            others = await fetch_page(page)
+        except Exception as e:
+            get_logger().warning(f"Search page {page} failed: {e}")
+            others = []
+        for preview in others:
+            results.setdefault(preview["productId"], preview)
+        page += 1
+    return list(results.values())[:limit]
+
+
+def _parse_product_page(root: etree._Element, url: str) -> Tuple[Product, Optional[Tuple[str, str]]]:
+    """Extract product details and (store_name, store_url) from a parsed product page."""
+    # Extract product information
+    title = _first(_XP_TITLE(root))
+    price_text = _first(_XP_PRICE(root))
+    currency = _first(_XP_CURRENCY(root)) or "USD"
+    pid = url.split("item/")[-1].split(".")[0]
+    # Unique http(s) URLs in page order (src and data-src often repeat), max 20
+    images: Dict[str, None] = {}
+    for i in _XP_IMAGES(root):
+        if i.startswith("http") and i not in images:
+            images[i] = None
+            if len(images) == 20:
+                break
+    rating_text = _first(_XP_RATING(root))
+    num_ratings_text = _first(_XP_NUM_RATINGS(root))
+
+    product = Product(
+        product_title=title or "",
+        product_url=url,
+        product_id=pid,
+        price=price_text,
+        currency=currency,
+        rating=_to_float(rating_text),
+        num_ratings=_to_int(num_ratings_text),
+        image_urls=list(images),
+    )
+
+    # Extract store information
+    store_links = _XP_STORE_LINKS(root)
+    store_url = None
+    store_name = "Unknown Seller"
+
+    if store_links:
+        store_url = store_links[0]
+        if not store_url.startswith("http"):
+            store_url = "https://www.aliexpress.com" + store_url
+
+        # Try to extract store name from the page
+        store_name_candidates = _XP_STORE_NAME(root)
+
+        for candidate in store_name_candidates:
+            candidate = candidate.strip()
+            if candidate and len(candidate) > 3:  # Basic filter for meaningful names
+                store_name = candidate
+                break
+
+    return product, (store_name, store_url) if store_url else None
+
+
+# Plain fetch first; JS rendering is only paid for when that page is incomplete
+_PRODUCT_FETCHES = (
+    {"render_js": False},
+    {"render_js": True, "auto_scroll": True, "rendering_wait": 8000},
+)
+_PRODUCT_JSON_RE = re.compile(r"window\.runParams\s*=|_init_data_\s*=")
+
+
+def _plain_page_usable(html: str, product: Product) -> bool:
+    """Whether a page fetched without JS rendering is as complete as a rendered one."""
+    if not product.product_title or product.price is None:
+        return False
+    if _PRODUCT_JSON_RE.search(html):
+        return True
+    return product.rating is not None and product.num_ratings is not None
 
 
 async def scrape_product_and_store_sf(sf_cfg: ScrapflyConfig, url: str) -> Tuple[Optional[Product], Optional[Tuple[str, str]]]:
@@ -101,142 +331,90 @@ async def scrape_product_and_store_sf(sf_cfg: ScrapflyConfig, url: str) -> Tuple
     
     Returns (Product, (store_name, store_url)) or (None, None) if failed.
     """
-    ScrapflyClient, ScrapeConfig, Selector = _require_scrapfly()
-    client = ScrapflyClient(key=sf_cfg.key)
-    headers = {"accept-language": "en-US,en;q=0.9"}
-    if sf_cfg.cookie:
-        headers["cookie"] = sf_cfg.cookie
+    _, ScrapeConfig, Selector = _require_scrapfly()
+    client = _client(sf_cfg)
+    headers = _headers(sf_cfg.cookie)
 
     try:
-        res = await client.async_scrape(
-            ScrapeConfig(
-                url,
-                asp=True,
-                country=sf_cfg.country,
-                headers=headers,
-                render_js=True,
-                auto_scroll=True,
-                rendering_wait=8000,
+        product, store = None, None
+        for opts in _PRODUCT_FETCHES:
+            res = await client.async_scrape(
+                ScrapeConfig(url, asp=True, country=sf_cfg.country, headers=headers, **opts)
             )
-        )
-        
-        if res.status_code != 200:
-            return None, None
-        
-        sel = Selector(res.content)
-        
-        # Extract product information
-        title = sel.xpath("//h1[@data-pl]/text()|//h1/text()").get()
-        price_text = sel.xpath("//span[contains(@class,'currentPrice')]/text()|//meta[@itemprop='price']/@content").get()
-        currency = sel.xpath("//meta[@itemprop='priceCurrency']/@content").get() or "USD"
-        pid = url.split("item/")[-1].split(".")[0]
-        imgs = sel.xpath("//img/@src|//img/@data-src").getall()
-        rating_text = sel.xpath("//div[contains(@class,'rating--wrap')]/div/text()|//span[contains(@class,'overview-rating-average')]/text()").get()
-        num_ratings_text = sel.xpath("//a[contains(@class,'reviewer--reviews')]/text()|//span[@id='j-cnt-review']/text()").get()
-
-        def to_float(s: Optional[str]) -> Optional[float]:
-            if not s:
-                return None
-            s = s.replace(",", ".")
-            num = "".join(ch for ch in s if (ch.isdigit() or ch == "."))
-            try:
-                return float(num)
-            except Exception:
-                return None
-
-        def to_int(s: Optional[str]) -> Optional[int]:
-            if not s:
-                return None
-            digits = "".join(ch for ch in s if ch.isdigit())
-            return int(digits) if digits else None
-
-        product = Product(
-            product_title=title or "",
-            product_url=url,
-            product_id=pid,
-            price=price_text,
-            currency=currency,
-            rating=to_float(rating_text),
-            num_ratings=to_int(num_ratings_text),
-            image_urls=[i for i in imgs if i and i.startswith("http")][:20],
-        )
-        
-        # Extract store information
-        store_links = sel.xpath("//a[contains(@href, '/store/')]/@href").getall()
-        store_url = None
-        store_name = "Unknown Seller"
-        
-        if store_links:
-            store_url = store_links[0]
-            if not store_url.startswith("http"):
-                store_url = "https://www.aliexpress.com" + store_url
-            
-            # Try to extract store name from the page
-            store_name_candidates = sel.xpath(
-                "//a[contains(@href, '/store/')]//text()|"
-                "//span[contains(@class, 'seller')]/text()|"
-                "//div[contains(@class, 'store')]//text()"
-            ).getall()
-            
-            for candidate in store_name_candidates:
-                candidate = candidate.strip()
-                if candidate and len(candidate) > 3:  # Basic filter for meaningful names
-                    store_name = candidate
-                    break
-
-        return product, (store_name, store_url) if store_url else None
+            if res.status_code != 200:
+                continue
+            product, store = _parse_product_page(Selector(res.content).root, url)
+            if _plain_page_usable(res.content, product):
+                break
+        return product, store
     
     except Exception:
         return None, None
 
 
+async def scrape_many_sf(
+    sf_cfg: ScrapflyConfig, urls: List[str], concurrency: int = 3
+) -> List[Tuple[Optional[Product], Optional[Tuple[str, str]]] | BaseException]:
+    """Scrape product pages concurrently with at most `concurrency` requests in flight.
+
+    Results keep the order of `urls`; a failed scrape is returned as its exception.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one(url: str) -> Tuple[Optional[Product], Optional[Tuple[str, str]]]:
+        async with sem:
+            try:
+                return await scrape_product_and_store_sf(sf_cfg, url)
+            finally:
+                # Be polite
+                await random_sleep(0.5, 1.2)
+
+    return await asyncio.gather(*(_one(u) for u in urls), return_exceptions=True)
+
+
 async def scrape_seller_sf(sf_cfg: ScrapflyConfig, seller_name: str, seller_url: str) -> Seller:
     """Minimal seller info via page HTML; may be sparse depending on localization."""
-    ScrapflyClient, ScrapeConfig, Selector = _require_scrapfly()
-    client = ScrapflyClient(key=sf_cfg.key)
-    headers = {"accept-language": "en-US,en;q=0.9"}
-    if sf_cfg.cookie:
-        headers["cookie"] = sf_cfg.cookie
+    _, ScrapeConfig, Selector = _require_scrapfly()
+    client = _client(sf_cfg)
+    headers = _headers(sf_cfg.cookie)
     
     try:
         res = await client.async_scrape(
             ScrapeConfig(seller_url, asp=True, country=sf_cfg.country, headers=headers, render_js=False)
         )
-        sel = Selector(res.content)
-        rating = sel.xpath("//div[contains(@class,'store-rating') or contains(@class,'score')]/text()").get()
-        followers = sel.xpath("//span[contains(@class,'follow')]/text()").get()
-        location = sel.xpath("//span[contains(@class,'store-loc')]/text()|//*[@data-role='store-location']/text()").get()
+        rating, followers, location = _seller_fields(Selector(res.content).root)
     except Exception:
         rating = None
         followers = None
         location = None
     
-    def to_float(s: Optional[str]) -> Optional[float]:
-        if not s:
-            return None
-        s = s.replace(",", ".")
-        num = "".join(ch for ch in s if (ch.isdigit() or ch == "."))
-        try:
-            return float(num)
-        except Exception:
-            return None
-    
-    def to_int(s: Optional[str]) -> Optional[int]:
-        if not s:
-            return None
-        digits = "".join(ch for ch in s if ch.isdigit())
-        return int(digits) if digits else None
-    
     return Seller(
         seller_name=seller_name,
         seller_url=seller_url,
-        seller_rating=to_float(rating),
-        num_followers=to_int(followers),
+        seller_rating=_to_float(rating),
+        num_followers=_to_int(followers),
         store_location=location,
     )
 
 
-async def run_with_scrapfly(query: str, *, max_suppliers: int, max_products_per_seller: int, limit: int, country: str, key: str, cookie: Optional[str] = None) -> ScrapeResult:
+async def scrape_sellers_sf(
+    sf_cfg: ScrapflyConfig, stores: List[Tuple[str, str]], concurrency: int = 3
+) -> List[Seller | BaseException]:
+    """Scrape (store_name, store_url) pairs concurrently, like scrape_many_sf."""
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one(store_name: str, store_url: str) -> Seller:
+        async with sem:
+            try:
+                return await scrape_seller_sf(sf_cfg, store_name, store_url)
+            finally:
+                # Be polite
+                await random_sleep(0.3, 0.8)
+
+    return await asyncio.gather(*(_one(n, u) for n, u in stores), return_exceptions=True)
+
+
+async def run_with_scrapfly(query: str, *, max_suppliers: int, max_products_per_seller: int, limit: int, country: str, key: str, cookie: Optional[str] = None, concurrency: int = 3) -> ScrapeResult:
     """End-to-end scrape orchestrated via Scrapfly backend - FIXED VERSION."""
     logger = get_logger()
     sf_cfg = ScrapflyConfig(key=key, country=country, cookie=cookie)
@@ -251,58 +429,59 @@ async def run_with_scrapfly(query: str, *, max_suppliers: int, max_products_per_
         return ScrapeResult(query=query)
     
     # Scrape products and collect store information
-    sellers_map: Dict[str, Tuple[str, List[Product]]] = {}
+    # store_url -> first store name seen / products, in discovery order
+    store_names: Dict[str, str] = {}
+    products_by_store: DefaultDict[str, List[Product]] = defaultdict(list)
     processed_products = 0
     
-    for preview in previews:
-        if processed_products >= limit or len(sellers_map) >= max_suppliers:
+    urls = [preview["url"] for preview in previews]
+    logger.info(f"Scraping up to {len(urls)} products (concurrency={concurrency})")
+    
+    # Fetch in windows of `concurrency` and fold each window in search order,
+    # so the caps are checked between windows and no paid request is made once
+    # either is reached; a window never asks for more than the products still wanted
+    next_url = 0
+    while next_url < len(urls):
+        if processed_products >= limit or len(products_by_store) >= max_suppliers:
             break
+        size = max(1, min(concurrency, limit - processed_products))
+        window = urls[next_url:next_url + size]
+        next_url += len(window)
+        scraped = await scrape_many_sf(sf_cfg, window, concurrency=concurrency)
+        
+        for url, outcome in zip(window, scraped):
+            if processed_products >= limit or len(products_by_store) >= max_suppliers:
+                break
+                
+            if isinstance(outcome, Exception):
+                logger.warning(f"Error scraping product {url}: {outcome}")
+                continue
             
-        try:
-            logger.info(f"Scraping product: {preview['url']}")
-            product, store_info = await scrape_product_and_store_sf(sf_cfg, preview["url"])
-            
+            product, store_info = outcome
             if product and store_info:
                 store_name, store_url = store_info
-                if store_url not in sellers_map:
-                    sellers_map[store_url] = (store_name, [])
-                sellers_map[store_url][1].append(product)
+                store_names.setdefault(store_url, store_name)
+                products_by_store[store_url].append(product)
                 processed_products += 1
                 logger.info(f"Successfully scraped product from store: {store_name}")
             else:
-                logger.warning(f"Failed to extract product or store info from {preview['url']}")
-            
-            # Be polite
-            await random_sleep(0.5, 1.2)
-            
-        except Exception as e:
-            logger.warning(f"Error scraping product {preview['url']}: {e}")
-            continue
+                logger.warning(f"Failed to extract product or store info from {url}")
     
-    logger.info(f"Found {len(sellers_map)} unique sellers")
+    logger.info(f"Found {len(products_by_store)} unique sellers")
     
-    # Build result with sellers
+    # Build result with sellers (products_by_store is already capped at max_suppliers)
     result = ScrapeResult(query=query)
-    seller_count = 0
+    stores = [(name, url) for url, name in store_names.items()]
+    sellers = await scrape_sellers_sf(sf_cfg, stores, concurrency=concurrency)
     
-    for store_url, (store_name, products) in sellers_map.items():
-        if seller_count >= max_suppliers:
-            break
-            
-        try:
-            seller = await scrape_seller_sf(sf_cfg, store_name, store_url)
-            # Add products (limited by max_products_per_seller)
-            seller.products = products[:max_products_per_seller]
-            result.suppliers.append(seller)
-            seller_count += 1
-            logger.info(f"Added seller: {store_name} with {len(seller.products)} products")
-            
-            # Be polite
-            await random_sleep(0.3, 0.8)
-            
-        except Exception as e:
-            logger.warning(f"Error scraping seller info for {store_name}: {e}")
+    for (store_name, store_url), seller in zip(stores, sellers):
+        if isinstance(seller, Exception):
+            logger.warning(f"Error scraping seller info for {store_name}: {seller}")
             continue
+        # Add products (limited by max_products_per_seller)
+        seller.products = products_by_store[store_url][:max_products_per_seller]
+        result.suppliers.append(seller)
+        logger.info(f"Added seller: {store_name} with {len(seller.products)} products")
     
     logger.info(f"Final result: {len(result.suppliers)} suppliers")
     return result
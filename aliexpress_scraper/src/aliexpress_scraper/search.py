@@ -29,11 +29,12 @@ async def discover_sellers(
     Scans search pages until `limit` items processed.
     """
     logger = get_logger()
-    sellers: list[Tuple[str, str, list[str]]] = []
-    seen_sellers: set[str] = set()
+    # seller_url -> (seller_name, product_urls, product_urls as a set), in discovery order
+    sellers: dict[str, Tuple[str, list[str], set[str]]] = {}
 
     processed = 0
     page_num = 1
+    encoded_query = quote_plus(query)  # same for every page
     while processed < limit and len(sellers) < max_suppliers:
         # Retry navigation a few times with simple backoff
         nav_retries = 3
@@ -41,7 +42,7 @@ async def discover_sellers(
         for attempt in range(nav_retries):
             try:
                 await page.goto(
-                    SEARCH_URL_TMPL.format(query=quote_plus(query), page=page_num),
+                    SEARCH_URL_TMPL.format(query=encoded_query, page=page_num),
                     wait_until="domcontentloaded",
                 )
                 break
@@ -79,19 +80,16 @@ async def discover_sellers(
                 # Fallback: skip if we can't find a seller link
                 continue
 
-            key = seller_url.split("?")[0]
-            if key not in seen_sellers:
-                seen_sellers.add(key)
-                sellers.append((seller_name.strip(), key, [href]))
-            else:
+            key = seller_url.partition("?")[0]
+            entry = sellers.get(key)
+            if entry is None:
+                sellers[key] = (seller_name.strip(), [href], {href})
+            elif href not in entry[2]:
                 # Append product to existing seller entry
-                for i, (sn, su, urls) in enumerate(sellers):
-                    if su == key and href not in urls:
-                        urls.append(href)
-                        sellers[i] = (sn, su, urls)
-                        break
+                entry[1].append(href)
+                entry[2].add(href)
             processed += 1
         page_num += 1
         await random_sleep(0.5, 1.2)
 
-    return sellers[:max_suppliers]
+    return [(name, key, urls) for key, (name, urls, _) in sellers.items()][:max_suppliers]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 """Seller/store page scraping logic."""
+import asyncio
 from typing import List, Optional
 
 from playwright.async_api import Page, Error as PWError
@@ -10,6 +11,41 @@ from .models import Seller
 from .parsers import detect_antibot
 from .utils import random_sleep
 
+# Candidate selectors per field, tried in order
+_SELECTORS = {
+    "rating": [".store-rating-score", "span.score"],
+    "followers": [".store-followers", "span.follow-num"],
+    "location": [".store-location", "span.store-loc", "[data-role='store-location']"],
+    "years": [".store-years", "span.years"],
+    "reviews": [".store-reviews-total", "span.total-reviews"],
+}
+
+# Runs in the page: first matching selector with non-empty trimmed text wins
+_EXTRACT_JS = """
+(sel) => {
+  const first = (list) => {
+    for (const s of list) {
+      const el = document.querySelector(s);
+      if (!el) continue;
+      const text = (el.innerText || "").trim();
+      if (text) return text;
+    }
+    return null;
+  };
+  const badges = Array.from(
+    document.querySelectorAll(".store-badges .badge, .store-badges img[alt]")
+  ).map(e => e.alt || e.textContent.trim()).filter(Boolean);
+  return {
+    rating: first(sel.rating),
+    followers: first(sel.followers),
+    location: first(sel.location),
+    years: first(sel.years),
+    reviews: first(sel.reviews),
+    badges: badges,
+  };
+}
+"""
+
 
 async def scrape_seller(page: Page, seller_name: str, seller_url: str) -> Optional[Seller]:
     delay = 0.8
@@ -20,25 +56,20 @@ async def scrape_seller(page: Page, seller_name: str, seller_url: str) -> Option
         except PWError:
             if attempt == 2:
                 raise
-            import asyncio as _asyncio
-
-            await _asyncio.sleep(delay)
+            await asyncio.sleep(delay)
             delay *= 1.8
     html = await page.content()
     if detect_antibot(html):
         raise AntiBotDetected("Anti-bot page detected on seller")
 
-    rating = await _float_sel(page, [".store-rating-score", "span.score"])
-    followers = await _int_sel(page, [".store-followers", "span.follow-num"])  # type: ignore[assignment]
-    location = await _text_sel(page, [".store-location", "span.store-loc", "[data-role='store-location']"])  # type: ignore[assignment]
-
-    badges: List[str] = await page.eval_on_selector_all(
-        ".store-badges .badge, .store-badges img[alt]",
-        "els => Array.from(els).map(e => e.alt || e.textContent.trim()).filter(Boolean)",
-    )
-
-    years_on_platform = await _int_sel(page, [".store-years", "span.years"])
-    total_reviews = await _int_sel(page, [".store-reviews-total", "span.total-reviews"])  # type: ignore[assignment]
+    # Pull every field in one round-trip instead of one query per selector
+    data = await page.evaluate(_EXTRACT_JS, _SELECTORS)
+    rating = _to_float(data["rating"])
+    followers = _to_int(data["followers"])
+    location = data["location"]
+    badges: List[str] = data["badges"]
+    years_on_platform = _to_int(data["years"])
+    total_reviews = _to_int(data["reviews"])
 
     await random_sleep(0.3, 1.0)
 
@@ -54,26 +85,14 @@ async def scrape_seller(page: Page, seller_name: str, seller_url: str) -> Option
     )
 
 
-async def _text_sel(page: Page, sels: list[str]) -> Optional[str]:
-    for sel in sels:
-        el = await page.query_selector(sel)
-        if el:
-            t = (await el.inner_text()).strip()
-            if t:
-                return t
-    return None
-
-
-async def _int_sel(page: Page, sels: list[str]) -> Optional[int]:
-    t = await _text_sel(page, sels)
+def _to_int(t: Optional[str]) -> Optional[int]:
     if not t:
         return None
     digits = "".join(ch for ch in t if ch.isdigit())
     return int(digits) if digits else None
 
 
-async def _float_sel(page: Page, sels: list[str]) -> Optional[float]:
-    t = await _text_sel(page, sels)
+def _to_float(t: Optional[str]) -> Optional[float]:
     if not t:
         return None
     t = t.replace(",", ".")
@@ -14,14 +14,23 @@ Flow:
 from __future__ import annotations
 
 import asyncio
+import gzip
+import hashlib
 import json
 import mimetypes
 import os
+import re
 import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Coroutine, Dict, Optional, Tuple, TypeVar
 
 try:  # graceful import for explicit Scrapfly error handling
     from scrapfly.errors import ApiHttpClientError as ScrapflyHttpError  # type: ignore
@@ -31,6 +40,20 @@ except Exception:  # pragma: no cover
         pass
 
 
+try:
+    import orjson  # type: ignore
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - optional
+    _HAS_ORJSON = False
+
+try:  # imported once here rather than per agent instance
+    import google.generativeai as genai  # type: ignore
+
+    _HAS_GENAI = True
+except ImportError:  # pragma: no cover - optional
+    _HAS_GENAI = False
+
 try:
     from dotenv import load_dotenv  # type: ignore
 
@@ -40,6 +63,8 @@ except ImportError:  # pragma: no cover - optional
 
 from .logger import get_logger
 from .models import ScrapeResult
+from .output import write_csv
+from .parsers import parse_price
 from .scrapfly_adapter import run_with_scrapfly
 
 
@@ -56,52 +81,64 @@ if _HAS_DOTENV:  # pragma: no cover - optional
         load_dotenv()
 
 
-def scrape_result_to_csv_string(result: ScrapeResult) -> str:
-    """Build a CSV string from ScrapeResult without touching disk."""
-    import csv
-    import io
-
-    fields = [
-        "seller_name",
-        "seller_url",
-        "product_title",
-        "product_url",
-        "product_id",
-        "price",
-        "currency",
-        "rating",
-        "num_ratings",
-        "num_orders",
-    ]
-    buf = io.StringIO()
-    w = csv.DictWriter(buf, fieldnames=fields)
-    w.writeheader()
-    for s in result.suppliers:
-        for p in s.products:
-            w.writerow(
-                {
-                    "seller_name": s.seller_name,
-                    "seller_url": s.seller_url,
-                    "product_title": p.product_title,
-                    "product_url": p.product_url,
-                    "product_id": p.product_id,
-                    "price": p.price or "",
-                    "currency": p.currency or "",
-                    "rating": p.rating or "",
-                    "num_ratings": p.num_ratings or "",
-                    "num_orders": p.num_orders or "",
-                }
-            )
-    return buf.getvalue()
+T = TypeVar("T")
+
+# One event loop shared by all handler threads, started on first use
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _event_loop() -> asyncio.AbstractEventLoop:
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="scrape-loop", daemon=True).start()
+            _LOOP = loop
+    return _LOOP
+
 
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the shared loop and block the calling thread for its result.
 
-def write_temp_csv(content: str) -> Path:
-    """Write CSV content to a temporary file in a temp dir within the repo."""
+    Unlike ``asyncio.run`` per request, this skips loop setup/teardown and lets
+    concurrent requests' scrapes interleave on one loop.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _event_loop()).result()
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse a JSON request body; orjson reads bytes directly when installed."""
+    if _HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, via orjson when installed.
+
+    Model dataclasses may appear anywhere in ``obj``: orjson encodes them
+    natively, the stdlib path goes through their ``to_dict()``.
+    """
+    if _HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), default=_model_to_dict).encode("utf-8")
+
+
+def _model_to_dict(obj: Any) -> Dict[str, Any]:
+    if isinstance(obj, ScrapeResult):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def write_scrape_csv(result: ScrapeResult) -> Path:
+    """Write ScrapeResult rows to a temp CSV within the repo and return its path."""
     tmp_dir = PUBLIC_DIR / "data" / "tmp"
     tmp_dir.mkdir(parents=True, exist_ok=True)
     fd, path = tempfile.mkstemp(prefix="scrape_", suffix=".csv", dir=str(tmp_dir))
-    with os.fdopen(fd, "w", encoding="utf-8") as f:
-        f.write(content)
+    os.close(fd)
+    # Same columns as the CLI export; its tuple rows skip DictWriter's per-field lookups
+    write_csv(Path(path), result)
     return Path(path)
 
 
@@ -112,6 +149,24 @@ def delete_file_safe(path: Path) -> None:
         LOGGER.warning("Failed to delete temp file: %s", path)
 
 
+# Blocking Gemini SDK calls run here rather than on the loop's default
+# executor, so slow model responses can't starve other to_thread work.
+GEMINI_WORKERS = 8
+_GEMINI_EXECUTOR = ThreadPoolExecutor(max_workers=GEMINI_WORKERS, thread_name_prefix="gemini")
+
+
+async def _generate(client: Any, content: str) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_GEMINI_EXECUTOR, client.generate_content, content)
+
+
+# Markdown code fences and a trailing JSON object in model responses
+_FENCE_RE = re.compile(r"^```(?:json)?\n|\n```$")
+_JSON_OBJ_RE = re.compile(r"\{[\s\S]*\}$")
+# Insight returned when a Gemini reply holds no parseable JSON (see _cacheable)
+_UNPARSED_INSIGHT = "Cleaner could not parse response"
+
+
 class CleanerAgent:
     """Simple AI cleaner using Google's Generative AI SDK (Gemini).
 
@@ -124,14 +179,11 @@ class CleanerAgent:
         self.api_key = os.environ.get("GOOGLE_API_KEY")
         self._client: Optional[Any] = None
         if self.api_key:
-            try:
-                import google.generativeai as genai  # type: ignore
-
+            if _HAS_GENAI:
                 genai.configure(api_key=self.api_key)
                 self._client = genai.GenerativeModel(self.model_name)
-            except ImportError as e:  # pragma: no cover
-                LOGGER.warning("google-generativeai not available: %s", e)
-                self._client = None
+            else:  # pragma: no cover
+                LOGGER.warning("google-generativeai not available")
 
     async def clean(
         self, result: ScrapeResult, csv_path: Optional[Path]
@@ -161,8 +213,9 @@ class CleanerAgent:
                     "Consider seasonal trends, shipping costs, and profit margins in your analysis. "
                     "Respond with valid JSON only, no markdown formatting."
                 )
-                # Send JSON as plain text content, not as structured data
-                payload_text = json.dumps(
+                # Send JSON as plain text content, not as structured data.
+                # Compact (no indent): about a third fewer prompt characters.
+                payload_text = _json_dumps(
                     {
                         "query": result.query,
                         "suppliers": [
@@ -189,25 +242,24 @@ class CleanerAgent:
                             for s in result.suppliers
                         ],
                     },
-                    indent=2,
-                )
+                ).decode("utf-8")
 
                 # Create content as simple text
                 content_parts = [prompt, "\n\nAliExpress Data:\n", payload_text]
 
                 if csv_path and csv_path.exists():
                     try:
-                        csv_content = csv_path.read_text(encoding="utf-8")
+                        # Only the head is sent, so don't read the whole file
+                        with csv_path.open(encoding="utf-8") as f:
+                            csv_content = f.read(2000)  # Limit CSV size
                         content_parts.append("\n\nCSV Data:\n")
-                        content_parts.append(csv_content[:2000])  # Limit CSV size
+                        content_parts.append(csv_content)
                     except OSError:
                         pass
 
                 # Send as single text content
                 full_content = "".join(content_parts)
-                resp = await asyncio.to_thread(
-                    self._client.generate_content, full_content
-                )  # type: ignore[union-attr]
+                resp = await _generate(self._client, full_content)
                 text = resp.text if hasattr(resp, "text") else str(resp)
                 cleaned = self.extract_json(text)
             else:
@@ -227,71 +279,80 @@ class CleanerAgent:
         self, ai_products: list, original_result: ScrapeResult
     ) -> None:
         """Ensure URLs are preserved in AI-processed products by matching with original data."""
-        # Create a lookup of original products by title
-        original_products = {}
-        for supplier in original_result.suppliers:
-            for product in supplier.products:
-                if product.product_title:
-                    original_products[product.product_title.lower().strip()] = {
-                        "product_url": product.product_url,
-                        "product_id": product.product_id,
-                        "seller_url": supplier.seller_url,
-                    }
+        missing = [
+            ai_product
+            for ai_product in ai_products
+            if not ai_product.get("product_url") or ai_product.get("product_url") == "#"
+        ]
+        if not missing:
+            return  # nothing to fill; skip building the index
+
+        # Lookup of original (product_url, product_id) by normalized title
+        original_products = {
+            product.product_title.casefold().strip(): (product.product_url, product.product_id)
+            for supplier in original_result.suppliers
+            for product in supplier.products
+            if product.product_title
+        }
 
         # Fill in missing URLs in AI products
-        for ai_product in ai_products:
-            if (
-                not ai_product.get("product_url")
-                or ai_product.get("product_url") == "#"
-            ):
-                title_key = (ai_product.get("product_title") or "").lower().strip()
-                if title_key in original_products:
-                    ai_product["product_url"] = original_products[title_key][
-                        "product_url"
-                    ]
-                    if not ai_product.get("product_id"):
-                        ai_product["product_id"] = original_products[title_key][
-                            "product_id"
-                        ]
+        for ai_product in missing:
+            title_key = (ai_product.get("product_title") or "").casefold().strip()
+            match = original_products.get(title_key)
+            if match is not None:
+                product_url, product_id = match
+                ai_product["product_url"] = product_url
+                if not ai_product.get("product_id"):
+                    ai_product["product_id"] = product_id
 
     @staticmethod
     def extract_json(text: str) -> Dict[str, Any]:
         """Try to parse JSON from a model response; tolerate code fences."""
-        import re
-
         s = text.strip()
         # Remove common markdown fences
-        if s.startswith("```") or s.startswith("```json"):
-            s = re.sub(r"^```(?:json)?\n|\n```$", "", s)
+        if s.startswith("```"):
+            s = _FENCE_RE.sub("", s)
         try:
             return json.loads(s)
         except json.JSONDecodeError:
             # Best-effort: find a JSON object in the string
-            m = re.search(r"\{[\s\S]*\}$", s)
+            m = _JSON_OBJ_RE.search(s)
             if m:
                 try:
                     return json.loads(m.group(0))
                 except json.JSONDecodeError:
                     pass
         # Last resort minimal structure
-        return {"insights": ["Cleaner could not parse response"], "raw": s}
+        return {"insights": [_UNPARSED_INSIGHT], "raw": s}
 
     @staticmethod
     def _local_fallback_clean(result: ScrapeResult) -> Dict[str, Any]:
         """Enhanced local fallback cleaner with basic dropshipping analysis."""
         products: list[Dict[str, Any]] = []
+        supplier_scores = []
         total_orders = 0
         total_ratings = 0
         rating_count = 0
+        high_rated_products = 0
+        high_volume_products = 0
 
+        # One pass: per-product scores, per-supplier sums and insight counts
         for s in result.suppliers:
+            supplier_rating_sum = 0
+            supplier_orders = 0
             for p in s.products:
                 orders = p.num_orders or 0
                 rating = p.rating or 0
                 total_orders += orders
+                supplier_rating_sum += rating
+                supplier_orders += orders
                 if rating > 0:
                     total_ratings += rating
                     rating_count += 1
+                if rating >= 4.5:
+                    high_rated_products += 1
+                if orders >= 1000:
+                    high_volume_products += 1
 
                 products.append(
                     {
@@ -307,27 +368,9 @@ class CleanerAgent:
                     }
                 )
 
-        # Sort by AI score (rating + order volume)
-        products.sort(
-            key=lambda x: (
-                x.get("ai_score", 0),
-                x.get("rating", 0),
-                x.get("num_orders", 0),
-            ),
-            reverse=True,
-        )
-        top_products = products[:10]
-
-        # Analyze suppliers
-        supplier_scores = []
-        for s in result.suppliers:
             avg_product_rating = (
-                sum(p.rating or 0 for p in s.products) / len(s.products)
-                if s.products
-                else 0
+                supplier_rating_sum / len(s.products) if s.products else 0
             )
-            total_product_orders = sum(p.num_orders or 0 for p in s.products)
-
             supplier_scores.append(
                 {
                     "seller_name": s.seller_name,
@@ -335,7 +378,7 @@ class CleanerAgent:
                     "seller_rating": s.seller_rating,
                     "num_products": len(s.products),
                     "avg_product_rating": round(avg_product_rating, 2),
-                    "total_orders": total_product_orders,
+                    "total_orders": supplier_orders,
                     "store_location": s.store_location,
                     "reliability_score": min(
                         100,
@@ -347,15 +390,22 @@ class CleanerAgent:
                 }
             )
 
+        # Sort by AI score (rating + order volume)
+        products.sort(
+            key=lambda x: (
+                x.get("ai_score", 0),
+                x.get("rating", 0),
+                x.get("num_orders", 0),
+            ),
+            reverse=True,
+        )
+        top_products = products[:10]
+
         supplier_scores.sort(key=lambda x: x.get("reliability_score", 0), reverse=True)
         top_sellers = supplier_scores[:5]
 
         # Generate intelligent insights
         avg_rating = total_ratings / rating_count if rating_count > 0 else 0
-        high_rated_products = len([p for p in products if (p.get("rating", 0) >= 4.5)])
-        high_volume_products = len(
-            [p for p in products if (p.get("num_orders", 0) >= 1000)]
-        )
 
         insights = [
             f"Analyzed {len(result.suppliers)} suppliers with {len(products)} total products",
@@ -380,9 +430,9 @@ class CleanerAgent:
 
         # Market analysis
         price_ranges = [
-            float(p.get("price", "0").replace("$", "").replace(",", ""))
-            for p in products
-            if p.get("price")
+            v
+            for v in (parse_price(p["price"]) for p in products if p["price"])
+            if v is not None
         ]
         avg_price = sum(price_ranges) / len(price_ranges) if price_ranges else 0
 
@@ -423,6 +473,19 @@ class CleanerAgent:
         }
 
 
+def _clamp_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Clamp scrape parameters to the ranges the orchestrator is asked to enforce."""
+    out = dict(params)
+    out["max_suppliers"] = max(1, min(10, int(out.get("max_suppliers", 5))))
+    out["max_products_per_seller"] = max(
+        1, min(10, int(out.get("max_products_per_seller", 1)))
+    )
+    out["limit"] = max(1, min(50, int(out.get("limit", 20))))
+    c = str(out.get("country", "AU")).upper()
+    out["country"] = c[:2] if len(c) >= 2 else "AU"
+    return out
+
+
 class OrchestratorAgent:
     """Optional planning agent using Gemini to validate/tune parameters.
 
@@ -433,14 +496,9 @@ class OrchestratorAgent:
         self.model_name = model
         self.api_key = os.environ.get("GOOGLE_API_KEY")
         self._client: Optional[Any] = None
-        if self.api_key:
-            try:
-                import google.generativeai as genai  # type: ignore
-
-                genai.configure(api_key=self.api_key)
-                self._client = genai.GenerativeModel(self.model_name)
-            except ImportError:
-                self._client = None
+        if self.api_key and _HAS_GENAI:
+            genai.configure(api_key=self.api_key)
+            self._client = genai.GenerativeModel(self.model_name)
 
     async def plan(self, query: str, params: Dict[str, Any]) -> Dict[str, Any]:
         if not self._client:
@@ -455,7 +513,7 @@ class OrchestratorAgent:
         content = f"{prompt}\n\nRequest: {json.dumps({'query': query, **params})}"
 
         try:
-            resp = await asyncio.to_thread(self._client.generate_content, content)  # type: ignore[union-attr]
+            resp = await _generate(self._client, content)
             text = resp.text if hasattr(resp, "text") else str(resp)
             cleaned = CleanerAgent.extract_json(text)
             # Merge back into params conservatively
@@ -463,21 +521,107 @@ class OrchestratorAgent:
             for k in ("max_suppliers", "max_products_per_seller", "limit", "country"):
                 if k in cleaned:
                     out[k] = cleaned[k]
-            # Clamp
-            out["max_suppliers"] = max(1, min(10, int(out.get("max_suppliers", 5))))
-            out["max_products_per_seller"] = max(
-                1, min(10, int(out.get("max_products_per_seller", 1)))
-            )
-            out["limit"] = max(1, min(50, int(out.get("limit", 20))))
-            c = str(out.get("country", "AU")).upper()
-            out["country"] = c[:2] if len(c) >= 2 else "AU"
-            return out
+            return _clamp_params(out)
         except (RuntimeError, ValueError, TypeError):
             return params
 
 
+@lru_cache(maxsize=None)
+def _agents() -> Tuple[OrchestratorAgent, CleanerAgent]:
+    """Agents (and their Gemini clients) built once and shared by all requests."""
+    return OrchestratorAgent(), CleanerAgent()
+
+
+# Recent identical searches -> (stored_at, result, cleaned), oldest first.
+# Only touched from the shared event loop thread, so no lock is needed.
+_RESULT_CACHE: "OrderedDict[Tuple[Any, ...], Tuple[float, ScrapeResult, Dict[str, Any]]]" = OrderedDict()
+RESULT_CACHE_SIZE = 256
+RESULT_CACHE_TTL = 600.0  # seconds; listings and prices drift
+
+
+def _cache_get(key: Tuple[Any, ...]) -> Optional[Tuple[ScrapeResult, Dict[str, Any]]]:
+    hit = _RESULT_CACHE.get(key)
+    if hit is None:
+        return None
+    if time.monotonic() - hit[0] > RESULT_CACHE_TTL:
+        del _RESULT_CACHE[key]
+        return None
+    _RESULT_CACHE.move_to_end(key)
+    return hit[1], hit[2]
+
+
+def _cacheable(result: ScrapeResult, cleaned: Dict[str, Any]) -> bool:
+    """Only complete runs are cached: an empty scrape or an unparsed Gemini
+    reply is usually transient and must not be replayed for RESULT_CACHE_TTL."""
+    return bool(result.suppliers) and cleaned.get("insights") != [_UNPARSED_INSIGHT]
+
+
+def _cache_put(key: Tuple[Any, ...], result: ScrapeResult, cleaned: Dict[str, Any]) -> None:
+    _RESULT_CACHE[key] = (time.monotonic(), result, cleaned)
+    _RESULT_CACHE.move_to_end(key)
+    while len(_RESULT_CACHE) > RESULT_CACHE_SIZE:
+        _RESULT_CACHE.popitem(last=False)
+
+
+# Identical searches currently being scraped/cleaned, so concurrent
+# duplicates share one run. Also loop-thread only.
+_IN_FLIGHT: Dict[Tuple[Any, ...], "asyncio.Future[Tuple[ScrapeResult, Dict[str, Any]]]"] = {}
+
+
+async def _single_flight(
+    key: Tuple[Any, ...],
+    run: Callable[[], Coroutine[Any, Any, Tuple[ScrapeResult, Dict[str, Any]]]],
+) -> Tuple[ScrapeResult, Dict[str, Any]]:
+    """Await the in-flight run for ``key``, starting ``run()`` if there is none."""
+    fut = _IN_FLIGHT.get(key)
+    if fut is None:
+        fut = asyncio.ensure_future(run())
+        _IN_FLIGHT[key] = fut
+        fut.add_done_callback(lambda _: _IN_FLIGHT.pop(key, None))
+    # Shield so one caller giving up doesn't cancel the others' shared run
+    return await asyncio.shield(fut)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check: any listed tag equal to ``etag`` (weakly), or "*"."""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+GZIP_MIN_BYTES = 1024
+
+
 class Handler(BaseHTTPRequestHandler):
     server_version = "AliScraperServer/0.1"
+    # Keep-alive; every response must therefore carry a Content-Length
+    protocol_version = "HTTP/1.1"
+
+    def _send_bytes(
+        self, status: HTTPStatus, data: bytes, headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(data)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self._set_cors()
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_json(self, status: HTTPStatus, payload: Dict[str, Any]) -> None:
+        data = _json_dumps(payload)
+        headers = {"Content-Type": "application/json", "Vary": "Accept-Encoding"}
+        if len(data) > GZIP_MIN_BYTES and "gzip" in self.headers.get("Accept-Encoding", ""):
+            # Level 1: repetitive keys compress well even at the cheapest setting
+            data = gzip.compress(data, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
+        self._send_bytes(status, data, headers)
 
     def _set_cors(self) -> None:
         # Same-origin in practice, but allow basic CORS for local dev.
@@ -499,54 +643,59 @@ class Handler(BaseHTTPRequestHandler):
         if file_path.is_dir():
             file_path = file_path / "index.html"
         if not file_path.exists():
-            self.send_response(HTTPStatus.NOT_FOUND)
-            self._set_cors()
-            self.end_headers()
-            self.wfile.write(b"Not found")
+            self._send_bytes(HTTPStatus.NOT_FOUND, b"Not found")
             return
 
         mime, _ = mimetypes.guess_type(str(file_path))
-        try:
-            data = file_path.read_bytes()
+        with ExitStack() as stack:
+            try:
+                f = stack.enter_context(file_path.open("rb"))
+                st = os.fstat(f.fileno())
+            except OSError as e:
+                LOGGER.error("Failed to read static file %s: %s", file_path, e)
+                self._send_bytes(HTTPStatus.INTERNAL_SERVER_ERROR, b"Error")
+                return
+            # ETag from mtime+size: revalidations cost a stat, not a read
+            etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+            if _etag_matches(self.headers.get("If-None-Match"), etag):
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.send_header("ETag", etag)
+                self._set_cors()
+                self.end_headers()
+                return
             self.send_response(HTTPStatus.OK)
             if mime:
                 self.send_header("Content-Type", mime)
+            self.send_header("Content-Length", str(st.st_size))
+            self.send_header("ETag", etag)
             self._set_cors()
             self.end_headers()
-            self.wfile.write(data)
-        except OSError as e:
-            LOGGER.error("Failed to read static file %s: %s", file_path, e)
-            self.send_response(HTTPStatus.INTERNAL_SERVER_ERROR)
-            self._set_cors()
-            self.end_headers()
-            self.wfile.write(b"Error")
+            try:
+                # Kernel sendfile where available; socket falls back to send() otherwise
+                self.connection.sendfile(f)
+            except OSError as e:
+                self.close_connection = True  # response is short of Content-Length
+                LOGGER.warning("Failed to send static file %s: %s", file_path, e)
 
     def do_POST(self) -> None:  # noqa: N802
         if self.path.split("?", 1)[0] != "/api/scrape":
-            self.send_response(HTTPStatus.NOT_FOUND)
-            self._set_cors()
-            self.end_headers()
-            self.wfile.write(b"Not found")
+            self.close_connection = True  # request body left unread
+            self._send_bytes(HTTPStatus.NOT_FOUND, b"Not found")
             return
 
         try:
             length = int(self.headers.get("Content-Length", "0"))
             raw = self.rfile.read(length) if length else b"{}"
-            body = json.loads(raw.decode("utf-8"))
+            body = _json_loads(raw)
         except (ValueError, json.JSONDecodeError, UnicodeDecodeError):
-            self.send_response(HTTPStatus.BAD_REQUEST)
-            self._set_cors()
-            self.end_headers()
-            self.wfile.write(b"Invalid JSON")
+            self.close_connection = True  # body may be partly unread
+            self._send_bytes(HTTPStatus.BAD_REQUEST, b"Invalid JSON")
             return
 
         # Extract params
         query = str(body.get("query", "")).strip()
         if not query:
-            self.send_response(HTTPStatus.BAD_REQUEST)
-            self._set_cors()
-            self.end_headers()
-            self.wfile.write(b"Missing query")
+            self._send_bytes(HTTPStatus.BAD_REQUEST, b"Missing query")
             return
 
         max_suppliers = int(body.get("max_suppliers", 5))
@@ -557,23 +706,35 @@ class Handler(BaseHTTPRequestHandler):
         aep_cookie = body.get("aep_cookie") or os.environ.get("AEP_USUC_F")
 
         if not scrapfly_key:
-            self.send_response(HTTPStatus.BAD_REQUEST)
-            self._set_cors()
-            self.end_headers()
-            self.wfile.write(b"Missing Scrapfly API key")
+            self._send_bytes(HTTPStatus.BAD_REQUEST, b"Missing Scrapfly API key")
             return
 
         # Run the orchestrator (optional), scraper, and cleaning agent
+        # Scoped to the Scrapfly key (hashed, so the cache doesn't hold the
+        # secret) so one key's results are never served to another
+        key_id = hashlib.sha256(scrapfly_key.encode("utf-8")).hexdigest()
+        cache_key = (query, max_suppliers, max_products_per_seller, limit, country, aep_cookie, key_id)
+
         async def _run() -> Tuple[ScrapeResult, Dict[str, Any]]:
-            planned = await OrchestratorAgent().plan(
-                query,
-                {
-                    "max_suppliers": max_suppliers,
-                    "max_products_per_seller": max_products_per_seller,
-                    "limit": limit,
-                    "country": country,
-                },
-            )
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                return cached
+            return await _single_flight(cache_key, _scrape_and_clean)
+
+        async def _scrape_and_clean() -> Tuple[ScrapeResult, Dict[str, Any]]:
+            orchestrator, cleaner = _agents()
+            params = {
+                "max_suppliers": max_suppliers,
+                "max_products_per_seller": max_products_per_seller,
+                "limit": limit,
+                "country": country,
+            }
+            # The planner only clamps to safe ranges; skip its Gemini round
+            # trip when there is nothing to clamp.
+            if _clamp_params(params) == params:
+                planned = params
+            else:
+                planned = await orchestrator.plan(query, params)
             result = await run_with_scrapfly(
                 query,
                 max_suppliers=int(planned.get("max_suppliers", max_suppliers)),
@@ -585,47 +746,37 @@ class Handler(BaseHTTPRequestHandler):
                 key=scrapfly_key,
                 cookie=aep_cookie,
             )
-            # Build CSV content and write to temp file
-            csv_str = scrape_result_to_csv_string(result)
-            tmp_csv = write_temp_csv(csv_str)
-            cleaned = await CleanerAgent().clean(result, tmp_csv)
+            # Stream CSV rows straight to a temp file; only the Gemini path reads it
+            tmp_csv = write_scrape_csv(result) if cleaner._client is not None else None
+            cleaned = await cleaner.clean(result, tmp_csv)
+            if _cacheable(result, cleaned):
+                _cache_put(cache_key, result, cleaned)
             return result, cleaned
 
         try:
-            result, cleaned = asyncio.run(_run())
+            result, cleaned = run_async(_run())
         except ScrapflyHttpError as e:
             # Surface upstream error details nicely to the frontend
             msg = str(e)
             LOGGER.error("Scrapfly error: %s", msg)
             payload = {"ok": False, "error": "scrapfly", "message": msg}
-            data = json.dumps(payload).encode("utf-8")
-            self.send_response(HTTPStatus.BAD_REQUEST)
-            self.send_header("Content-Type", "application/json")
-            self._set_cors()
-            self.end_headers()
-            self.wfile.write(data)
+            self._send_json(HTTPStatus.BAD_REQUEST, payload)
             return
         except (RuntimeError, OSError, ValueError) as e:
             LOGGER.error("Scrape job failed: %s", e)
-            self.send_response(HTTPStatus.INTERNAL_SERVER_ERROR)
-            self._set_cors()
-            self.end_headers()
-            self.wfile.write(b"Scrape failed")
+            self._send_bytes(HTTPStatus.INTERNAL_SERVER_ERROR, b"Scrape failed")
             return
 
-        # Respond with cleaned + raw
+        # Respond with cleaned + raw; the result is encoded straight from the
+        # dataclasses. Clients that only want insights can send "raw": false.
         payload = {
             "ok": True,
             "query": query,
             "cleaned": cleaned,
-            "raw": result.to_dict(),
         }
-        data = json.dumps(payload).encode("utf-8")
-        self.send_response(HTTPStatus.OK)
-        self.send_header("Content-Type", "application/json")
-        self._set_cors()
-        self.end_headers()
-        self.wfile.write(data)
+        if body.get("raw", True) is not False:
+            payload["raw"] = result
+        self._send_json(HTTPStatus.OK, payload)
 
 
 def main(host: str = "127.0.0.1", port: int = 8787) -> int:
@@ -638,6 +789,8 @@ def main(host: str = "127.0.0.1", port: int = 8787) -> int:
         LOGGER.info("Shutting down...")
     finally:
         httpd.server_close()
+        if _LOOP is not None:
+            _LOOP.call_soon_threadsafe(_LOOP.stop)
     return 0
 
 
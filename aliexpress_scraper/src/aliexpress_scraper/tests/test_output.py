@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from aliexpress_scraper import output
+from aliexpress_scraper.models import Product, Seller
+
+
+class _FakeResponse:
+    def __init__(self, body: bytes):
+        self._body = body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, size):
+        for i in range(0, len(self._body), size):
+            yield self._body[i : i + size]
+
+
+class _FakeSession:
+    """Stands in for requests.Session; serves image bodies from a dict."""
+
+    bodies: dict = {}
+
+    def mount(self, prefix, adapter):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def get(self, url, timeout=None, stream=False):
+        return _FakeResponse(self.bodies[url])
+
+
+def _product(pid, *urls):
+    return Product(product_title=pid, product_url="", product_id=pid, image_urls=list(urls))
+
+
+def test_download_images_dedupes_identical_bodies_per_seller(tmp_path, monkeypatch):
+    _FakeSession.bodies = {
+        "https://img/a.jpg": b"same" * 50_000,
+        "https://img/a-copy.jpg": b"same" * 50_000,
+        "https://img/b.jpg": b"other",
+    }
+    monkeypatch.setattr(output.requests, "Session", _FakeSession)
+    p1 = _product("1", "https://img/a.jpg", "https://img/b.jpg")
+    p2 = _product("2", "https://img/a-copy.jpg")
+    other = _product("3", "https://img/a.jpg")
+    sellers = [
+        Seller(seller_name="Shop One", seller_url="", products=[p1, p2]),
+        Seller(seller_name="Shop Two", seller_url="", products=[other]),
+    ]
+
+    output.download_images(tmp_path, sellers)
+
+    shop_one = tmp_path / "shop-one"
+    saved = sorted(f.name for f in shop_one.iterdir())
+    assert len(saved) == 2  # the copy of a.jpg was discarded, no temp files left
+    assert not any(name.endswith(".tmp") for name in saved)
+    # Both products point at the one file holding that body
+    assert p2.image_urls == [p1.image_urls[0]]
+    # Dedupe is per seller folder: the other seller keeps its own copy
+    assert len(list((tmp_path / "shop-two").iterdir())) == 1
+    assert other.image_urls[0].startswith(str(tmp_path / "shop-two"))
@@ -2,7 +2,12 @@ from __future__ import annotations
 
 from bs4 import BeautifulSoup
 
-from aliexpress_scraper.parsers import detect_antibot, parse_product_id, parse_text
+from aliexpress_scraper.parsers import (
+    detect_antibot,
+    parse_price,
+    parse_product_id,
+    parse_text,
+)
 
 
 def test_parse_product_id_common_urls():
@@ -11,6 +16,15 @@ def test_parse_product_id_common_urls():
     assert parse_product_id("https://a.aliexpress.com/_ABCDE") is None
 
 
+def test_parse_price_formats():
+    assert parse_price("$3.10") == 3.10
+    assert parse_price("AU $1,299.50") == 1299.5
+    assert parse_price("US $1.99 - 3.99") == 1.99
+    assert parse_price("€12") == 12.0
+    assert parse_price("0") == 0.0
+    assert parse_price("Free") is None
+
+
 def test_detect_antibot_keywords():
     html = """
     <html><body>
@@ -24,3 +38,16 @@ def test_detect_antibot_keywords():
 def test_parse_text_helper():
     soup = BeautifulSoup("<div><span class='x'> Hello <b>world</b> </span></div>", "html.parser")
     assert parse_text(soup, ".x") == "Hello world"
+
+
+def test_parse_text_raw_html():
+    assert parse_text("<div><span class='x'> Hello <b>world</b> </span></div>", ".x") == "Hello world"
+    assert parse_text("<div></div>", ".x") is None
+
+
+def test_parse_text_xhtml_with_encoding_declaration():
+    doc = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<html xmlns="http://www.w3.org/1999/xhtml"><body><span class="x">Caf\u00e9</span></body></html>'
+    )
+    assert parse_text(doc, ".x") == "Caf\u00e9"
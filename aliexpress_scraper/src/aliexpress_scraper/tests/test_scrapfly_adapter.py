@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from aliexpress_scraper.scrapfly_adapter import _html_root, _parse_product_page, _plain_page_usable
+
+URL = "https://www.aliexpress.com/item/1005001234567890.html"
+
+
+def _parse(html: str):
+    return _parse_product_page(_html_root(html), URL)
+
+
+def test_script_price_keeps_pattern_priority_over_overlapping_match():
+    # The salePrice pattern spans the first formattedPrice; the plain
+    # formattedPrice pattern still has priority and must see it.
+    html = """<html><body><script>
+    var d = {"salePrice":{"currency":"USD","formattedPrice":"US $3.10"},
+             "originalPrice":{"formattedPrice":"US $5.00"}};
+    </script></body></html>"""
+    product, _ = _parse(html)
+    assert product.price == "US $3.10"
+
+
+def test_text_price_tries_patterns_in_order():
+    # "5 USD" and "$7" overlap the higher-priority "USD $7"
+    product, _ = _parse("<html><body><p>5 USD $7 USD 9</p></body></html>")
+    assert product.price == "$7"
+    assert product.currency == "USD"
+
+
+def test_store_id_prefers_seller_id_inside_broader_match():
+    # 'seller.*?(\d{10,})' would swallow the sellerId key if run as one alternation
+    html = """<html><body><script>
+    var s = {"seller":{"sellerId":"22222222","memberId":1234567890123}};
+    </script></body></html>"""
+    _, store = _parse(html)
+    assert store is not None
+    assert store[1] == "https://www.aliexpress.com/store/22222222"
+
+
+def test_plain_page_with_only_title_and_price_needs_render():
+    html = """<html><body><h1>Wireless Earbuds Bluetooth 5.3 Headset</h1>
+    <p>US $12.99</p></body></html>"""
+    product, _ = _parse(html)
+    assert product.product_title and product.price is not None
+    assert not _plain_page_usable(html, product)
+    with_json = html.replace("</body>", "<script>window.runParams = {};</script></body>")
+    assert _plain_page_usable(with_json, _parse(with_json)[0])
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import lxml.html
+import pytest
+
+from aliexpress_scraper.scrapfly_adapter_clean import _XP_SELLER_FIELDS, _first, _seller_fields
+
+STORE_PAGES = [
+    # all three fields, plain markup
+    """<html><body>
+    <div class="store-rating">97.5%</div>
+    <span class="follow-num">12.3K</span>
+    <span class="store-loc">China</span>
+    </body></html>""",
+    # location via data-role, rating via "score", fields out of order
+    """<html><body>
+    <p data-role="store-location">Guangdong</p>
+    <div class="seller-score">4.8</div>
+    <span class="followers">980</span>
+    </body></html>""",
+    # empty first match, so the next one wins
+    """<html><body>
+    <div class="score"></div><div class="score">4.1</div>
+    <span class="follow"><b>x</b></span><span class="follow">55</span>
+    </body></html>""",
+    # own text only after a nested match: document order must be kept
+    """<html><body>
+    <div class="store-rating"><div class="score">inner</div>outer</div>
+    <span class="store-loc"><i>flag</i>Shenzhen</span>
+    </body></html>""",
+    # span with both classes; div "follow" must not count as followers
+    """<html><body>
+    <div class="follow">no</div>
+    <span class="follow store-loc">both</span>
+    </body></html>""",
+    # nothing to find
+    "<html><body><p class='other'>none</p></body></html>",
+]
+
+
+@pytest.mark.parametrize("html", STORE_PAGES)
+def test_seller_fields_match_per_field_xpaths(html):
+    root = lxml.html.fromstring(html)
+    expected = tuple(_first(xp(root)) for xp in _XP_SELLER_FIELDS.values())
+    assert _seller_fields(root) == expected
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import pytest
+
+from aliexpress_scraper.server import _etag_matches
+
+ETAG = '"18681cd1-5b76"'
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, False),
+        ("", False),
+        (ETAG, True),
+        (f'"other", {ETAG}', True),
+        (f'W/{ETAG}', True),
+        ("*", True),
+        ('"18681cd1-5b7"', False),
+        ('"x18681cd1-5b76", "other"', False),
+    ],
+)
+def test_etag_matches(header, expected):
+    assert _etag_matches(header, ETAG) is expected
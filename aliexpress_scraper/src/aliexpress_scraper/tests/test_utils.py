@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib import error as urlerror
+
+import pytest
+
+from aliexpress_scraper import utils
+from aliexpress_scraper.utils import check_robots_txt, exponential_backoff_retry, is_transient_error
+
+
+class _Flaky(Exception):
+    def __init__(self, retry_after=None):
+        super().__init__("flaky")
+        self.retry_after = retry_after
+
+
+class _Status(Exception):
+    def __init__(self, status):
+        super().__init__(status)
+        self.http_status_code = status
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff delays instead of waiting them out."""
+    recorded = []
+
+    async def fake_sleep(d):
+        recorded.append(d)
+
+    monkeypatch.setattr(utils.asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+def _failing(exc, calls):
+    async def fn():
+        calls.append(1)
+        raise exc
+
+    return fn
+
+
+@pytest.mark.asyncio
+async def test_no_sleep_after_last_attempt(sleeps):
+    calls = []
+    fn = exponential_backoff_retry(retries=3, base=0.5)(_failing(_Flaky(), calls))
+    with pytest.raises(_Flaky):
+        await fn()
+    assert len(calls) == 3
+    assert len(sleeps) == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_if_false_reraises_immediately(sleeps):
+    calls = []
+    fn = exponential_backoff_retry(retries=5, retry_if=lambda e: False)(_failing(_Flaky(), calls))
+    with pytest.raises(_Flaky):
+        await fn()
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_a_floor_for_the_delay(sleeps):
+    calls = []
+    fn = exponential_backoff_retry(retries=2, base=0.1, strategy="exponential", jitter=0.0)(
+        _failing(_Flaky(retry_after=7), calls)
+    )
+    with pytest.raises(_Flaky):
+        await fn()
+    assert sleeps == [7.0]
+
+
+@pytest.mark.asyncio
+async def test_max_elapsed_stops_before_a_wait_past_the_budget(sleeps):
+    calls = []
+    fn = exponential_backoff_retry(retries=5, base=0.1, max_elapsed=1.0)(
+        _failing(_Flaky(retry_after=5), calls)
+    )
+    with pytest.raises(_Flaky):
+        await fn()
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_retries_until_success(sleeps):
+    calls = []
+
+    @exponential_backoff_retry(retries=3, base=0.1)
+    async def fn():
+        calls.append(1)
+        if len(calls) < 3:
+            raise _Flaky()
+        return "ok"
+
+    assert await fn() == "ok"
+    assert len(sleeps) == 2
+    assert all(d >= 0.1 for d in sleeps)
+
+
+@pytest.mark.parametrize(
+    "exc, expected",
+    [
+        (asyncio.TimeoutError(), True),
+        (ConnectionResetError(), True),
+        (_Status(429), True),
+        (_Status(503), True),
+        (_Status(404), False),
+        (ValueError("bad"), False),
+    ],
+)
+def test_is_transient_error(exc, expected):
+    assert is_transient_error(exc) is expected
+
+
+@pytest.fixture
+def robots(monkeypatch):
+    """Serve robots.txt bodies from a dict and count fetches per URL."""
+    bodies: dict = {}
+    fetches: list = []
+
+    def fake_urlopen(url, timeout=None):
+        fetches.append(url)
+        body = bodies.get(url)
+        if isinstance(body, BaseException):
+            raise body
+        return io.BytesIO(body.encode())
+
+    monkeypatch.setattr(utils.urlrequest, "urlopen", fake_urlopen)
+    monkeypatch.setattr(utils, "_robots_cache", {})
+    monkeypatch.setattr(utils, "_robots_locks", {})
+    return bodies, fetches
+
+
+def test_robots_txt_is_fetched_once_per_host(robots):
+    bodies, fetches = robots
+    bodies["https://shop.example/robots.txt"] = "User-agent: *\nDisallow: /private\n"
+    assert check_robots_txt("https://shop.example/item/1.html")
+    assert not check_robots_txt("https://shop.example/private/x")
+    assert fetches == ["https://shop.example/robots.txt"]
+
+
+def test_robots_txt_rules_past_the_size_cap_are_ignored(robots):
+    bodies, _ = robots
+    padding = "#" * (utils.ROBOTS_MAX_BYTES * 2) + "\n"
+    bodies["https://big.example/robots.txt"] = "User-agent: *\n" + padding + "Disallow: /\n"
+    assert check_robots_txt("https://big.example/item/1.html")
+
+
+def test_robots_txt_failed_fetch_allows_and_retries_after_fail_ttl(robots):
+    bodies, fetches = robots
+    url = "https://down.example/robots.txt"
+    bodies[url] = urlerror.URLError("unreachable")
+    assert check_robots_txt("https://down.example/a")
+    assert check_robots_txt("https://down.example/b")
+    assert len(fetches) == 1
+
+    # Age the failed entry past ROBOTS_FAIL_TTL (still well inside ROBOTS_TTL)
+    rp, fetched_at = utils._robots_cache[url]
+    utils._robots_cache[url] = (rp, fetched_at - utils.ROBOTS_FAIL_TTL - 1)
+    bodies[url] = "User-agent: *\nDisallow: /\n"
+    assert not check_robots_txt("https://down.example/a")
+    assert len(fetches) == 2
+
+
+def test_robots_txt_cold_host_shares_one_fetch(robots, monkeypatch):
+    bodies, fetches = robots
+    bodies["https://busy.example/robots.txt"] = "User-agent: *\nAllow: /\n"
+    fake = utils.urlrequest.urlopen
+
+    def slow_urlopen(url, timeout=None):
+        time.sleep(0.05)
+        return fake(url, timeout)
+
+    monkeypatch.setattr(utils.urlrequest, "urlopen", slow_urlopen)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(check_robots_txt, [f"https://busy.example/{i}" for i in range(8)]))
+    assert all(results)
+    assert len(fetches) == 1
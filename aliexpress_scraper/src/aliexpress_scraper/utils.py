@@ -4,26 +4,56 @@ from __future__ import annotations
 import asyncio
 import random
 import re
+import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from functools import wraps
-from typing import Any, Awaitable, Callable, Optional, TypeVar
+from functools import lru_cache, wraps
+from typing import Any, Awaitable, Callable, Literal, Optional, TypeVar
 from urllib.parse import urlparse
-from urllib import robotparser
+from urllib import error as urlerror, request as urlrequest, robotparser
+
+try:
+    from protego import Protego  # type: ignore
+
+    _HAS_PROTEGO = True
+except ImportError:  # pragma: no cover - optional
+    _HAS_PROTEGO = False
 
 T = TypeVar("T")
 
 
+_SLUG_NONALNUM = re.compile(r"[^a-z0-9]+")
+# ASCII letters/digits -> lowercase, every other ASCII char -> "-"
+_SLUG_TABLE = str.maketrans(
+    {chr(c): (chr(c).lower() if chr(c).isalnum() else "-") for c in range(128)}
+)
+
+
 def slugify(text: str) -> str:
-    s = text.lower()
-    s = re.sub(r"[^a-z0-9]+", "-", s)
-    s = re.sub(r"-+", "-", s).strip("-")
+    if text.isascii():
+        if text.isalnum():  # ids and single words: nothing to replace
+            return text.lower()
+        # One C-level translate, then split/join collapses and strips dash runs
+        return "-".join(filter(None, text.translate(_SLUG_TABLE).split("-"))) or "query"
+    # The greedy `+` already collapses runs, so no separate "-+" pass is needed
+    s = _SLUG_NONALNUM.sub("-", text.lower()).strip("-")
     return s or "query"
 
 
+# (epoch second, its formatted timestamp); one tuple so threads never see a torn pair
+_iso_cache: tuple[int, str] = (-1, "")
+
+
 def iso_now() -> str:
-    return datetime.now(timezone.utc).astimezone().isoformat(timespec="seconds")
+    # Second resolution, so every model built within the same second shares one string
+    global _iso_cache
+    sec = int(time.time())
+    cached_sec, text = _iso_cache
+    if sec != cached_sec:
+        text = datetime.fromtimestamp(sec, timezone.utc).astimezone().isoformat(timespec="seconds")
+        _iso_cache = (sec, text)
+    return text
 
 
 def random_sleep(min_s: float = 0.25, max_s: float = 1.5) -> Awaitable[None]:
@@ -47,40 +77,166 @@ def exponential_backoff_retry(
     factor: float = 2.0,
     jitter: float = 0.2,
     exceptions: tuple[type[BaseException], ...] = (Exception,),
+    strategy: Literal["decorrelated", "exponential"] = "decorrelated",
+    retry_if: Optional[Callable[[BaseException], bool]] = None,
+    retry_after_attr: str = "retry_after",
+    max_elapsed: Optional[float] = None,
 ) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
-    """Retry async function with exponential backoff and jitter."""
+    """Retry async function with jittered backoff.
+
+    "decorrelated" (default) draws each delay from [base, 3 * previous delay],
+    capped at base * factor**retries, so concurrent callers spread out instead
+    of retrying in lockstep. "exponential" is plain geometric growth with
+    +/- `jitter` noise.
+
+    Caught exceptions for which `retry_if` returns False are re-raised at once
+    (e.g. pass `is_transient_error`). A numeric `retry_after_attr` attribute
+    on the exception (seconds) is a floor for the next delay; Scrapfly errors
+    carry theirs as "retry_delay".
+
+    The last failure is raised without a trailing sleep, and with
+    `max_elapsed` (seconds) it is raised as soon as the next wait would end
+    past that budget. The budget is measured with time.monotonic(), so wall
+    clock steps (NTP, suspend) cannot stretch or cut it short.
+    """
+    cap = base * factor**retries
 
     def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> T:
             delay = base
-            last_exc: Optional[BaseException] = None
+            # Only read the clock when there is a budget to enforce
+            start = time.monotonic() if max_elapsed is not None else 0.0
             for attempt in range(retries):
                 try:
                     return await func(*args, **kwargs)
                 except exceptions as exc:  # type: ignore[misc]
-                    last_exc = exc
-                    # jittered delay
-                    d = delay * (1 + random.uniform(-jitter, jitter))
-                    await asyncio.sleep(max(0.1, d))
-                    delay *= factor
-            assert last_exc is not None
-            raise last_exc
+                    if retry_if is not None and not retry_if(exc):
+                        raise
+                    if attempt == retries - 1:
+                        raise  # out of attempts: no point sleeping first
+                    if strategy == "decorrelated":
+                        delay = min(cap, random.uniform(base, delay * 3))
+                        d = delay
+                    else:
+                        # jittered delay
+                        d = delay * (1 + random.uniform(-jitter, jitter))
+                        delay = min(delay * factor, cap)
+                    hint = getattr(exc, retry_after_attr, None)
+                    if isinstance(hint, (int, float)) and not isinstance(hint, bool):
+                        d = max(d, float(hint))
+                    d = max(0.1, d)
+                    if max_elapsed is not None and time.monotonic() - start + d > max_elapsed:
+                        raise
+                    await asyncio.sleep(d)
+            raise ValueError("retries must be >= 1")
 
         return wrapper
 
     return decorator
 
 
-def check_robots_txt(url: str, user_agent: str = "*") -> bool:
-    """Return True if URL is allowed by robots.txt for given UA."""
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """True for timeouts, dropped connections and retryable HTTP statuses.
+
+    Understands Scrapfly errors (`is_retryable` / `http_status_code`) and
+    requests' HTTPError (`response.status_code`).
+    """
+    if isinstance(exc, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return True
+    if getattr(exc, "is_retryable", False) is True:
+        return True
+    status = getattr(exc, "http_status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status in RETRYABLE_STATUSES
+
+
+ROBOTS_TTL = 600.0  # seconds a fetched robots.txt is reused
+ROBOTS_FAIL_TTL = 60.0  # seconds before retrying a robots.txt that could not be fetched
+_robots_cache: dict[str, tuple[Optional[robotparser.RobotFileParser], float]] = {}
+_robots_locks: dict[str, threading.Lock] = {}
+ROBOTS_TIMEOUT = 5.0  # seconds; RobotFileParser.read() has no timeout of its own
+ROBOTS_MAX_BYTES = 500 * 1024  # Google's limit; anything past it is ignored
+
+
+class _TimedRobotFileParser(robotparser.RobotFileParser):
+    """RobotFileParser whose read() gives up after ROBOTS_TIMEOUT seconds.
+
+    The body is capped at ROBOTS_MAX_BYTES and matched with Protego when it
+    is installed (faster, and follows Google's wildcard/precedence rules).
+    """
+
+    _protego: Optional[Any] = None
+
+    def read(self) -> None:
+        # Same status handling as the stdlib read(), plus a timeout
+        try:
+            f = urlrequest.urlopen(self.url, timeout=ROBOTS_TIMEOUT)
+        except urlerror.HTTPError as err:
+            if err.code in (401, 403):
+                self.disallow_all = True
+            elif 400 <= err.code < 500:
+                self.allow_all = True
+            err.close()
+        else:
+            with f:
+                raw = f.read(ROBOTS_MAX_BYTES)
+            # "replace": the cap may cut a multi-byte character in half
+            text = raw.decode("utf-8", "replace")
+            if _HAS_PROTEGO:
+                self._protego = Protego.parse(text)
+            else:
+                self.parse(text.splitlines())
+
+    def can_fetch(self, useragent: str, url: str) -> bool:
+        if self._protego is not None:
+            return self._protego.can_fetch(url, useragent)
+        return super().can_fetch(useragent, url)
+
+
+def _robots_fresh(
+    cached: Optional[tuple[Optional[robotparser.RobotFileParser], float]], now: float
+) -> bool:
+    if cached is None:
+        return False
+    ttl = ROBOTS_TTL if cached[0] is not None else ROBOTS_FAIL_TTL
+    return now - cached[1] < ttl
+
+
+@lru_cache(maxsize=4096)
+def _robots_url(url: str) -> str:
+    """robots.txt URL for the host of `url`; also the _robots_cache key."""
     parsed = urlparse(url)
-    robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
-    rp = robotparser.RobotFileParser()
-    rp.set_url(robots_url)
-    try:
-        rp.read()
-    except Exception:
+    return f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+
+
+def check_robots_txt(url: str, user_agent: str = "*") -> bool:
+    """Return True if URL is allowed by robots.txt for given UA.
+
+    The parsed robots.txt is cached per host for ROBOTS_TTL seconds (failed
+    fetches for ROBOTS_FAIL_TTL); concurrent callers for a cold host share
+    one fetch.
+    """
+    robots_url = _robots_url(url)
+    cached = _robots_cache.get(robots_url)
+    if not _robots_fresh(cached, time.monotonic()):
+        with _robots_locks.setdefault(robots_url, threading.Lock()):
+            # Another thread may have fetched it while we waited
+            cached = _robots_cache.get(robots_url)
+            if not _robots_fresh(cached, time.monotonic()):
+                rp: Optional[robotparser.RobotFileParser] = _TimedRobotFileParser(robots_url)
+                try:
+                    rp.read()
+                except Exception:
+                    rp = None
+                cached = (rp, time.monotonic())
+                _robots_cache[robots_url] = cached
+    rp = cached[0]
+    if rp is None:
         # If robots cannot be fetched, default to allowed=False only if respect flag used elsewhere
         return True
     return rp.can_fetch(user_agent, url)
@@ -14,6 +14,12 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 from aliexpress_scraper.server import CleanerAgent
 from aliexpress_scraper.models import ScrapeResult, Seller, Product
 
+try:  # needs the scrapfly SDK; the Gemini check runs without it
+    # Private alias so pytest doesn't collect the coroutine a second time here
+    from test_product import test_product_scraping as _product_check
+except ImportError:  # pragma: no cover - optional
+    _product_check = None
+
 
 async def test_gemini_integration():
     print("🧠 Testing Gemini AI Integration...")
@@ -79,8 +85,21 @@ async def test_gemini_integration():
         return True
 
 
+async def run_all():
+    """Run the independent network checks concurrently (wall time = slowest)."""
+    tests = [test_gemini_integration()]
+    if _product_check is not None:
+        tests.append(_product_check())
+    return await asyncio.gather(*tests, return_exceptions=True)
+
+
 async def main():
-    success = await test_gemini_integration()
+    results = await run_all()
+    for r in results:
+        if isinstance(r, BaseException):
+            print(f"❌ Check raised: {r!r}")
+    # Gemini check must report True; the product check passes unless it raised
+    success = results[0] is True and not any(isinstance(r, BaseException) for r in results[1:])
 
     print("\n" + "=" * 40)
     if success:
@@ -6,13 +6,24 @@ import os
 from scrapfly import ScrapflyClient, ScrapeConfig
 from parsel import Selector
 
+_client = None
+
+
+def _get_client(key):
+    """One ScrapflyClient per process, so repeated runs reuse its connections."""
+    global _client
+    if _client is None:
+        _client = ScrapflyClient(key=key)
+    return _client
+
+
 async def test_product_scraping():
     key = os.environ.get("SCRAPFLY_KEY")
     if not key:
         print("Please set SCRAPFLY_KEY environment variable")
         return
     
-    client = ScrapflyClient(key=key)
+    client = _get_client(key)
     
     # Test with one of the product URLs from our search results
     product_id = "1005008490033064"  # From the first item in our search results
@@ -37,13 +48,16 @@ async def test_product_scraping():
     print(f"Response status: {res.status_code}")
     
     if res.status_code == 200:
+        # Encode once: the same bytes are saved and handed to lxml
+        body = res.content.encode("utf-8")
+
         # Save the HTML for inspection
-        with open("product_page.html", "w", encoding="utf-8") as f:
-            f.write(res.content)
+        with open("product_page.html", "wb") as f:
+            f.write(body)
         print("Saved product HTML to product_page.html")
         
         # Parse with Parsel
-        sel = Selector(res.content)
+        sel = Selector(body=body, encoding="utf-8")
         
         # Look for store information
         store_links = sel.xpath("//a[contains(@href, '/store/')]/@href").getall()